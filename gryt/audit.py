@@ -6,16 +6,89 @@ Implements NIST 800-161 requirements for change tracking and accountability.
 """
 from __future__ import annotations
 
+import atexit
 import json
 import csv
+import logging
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
 from .data import SqliteData
 
 
+logger = logging.getLogger(__name__)
+
+_AUDIT_COLUMNS = (
+    "event_id", "timestamp", "event_type", "actor", "resource_type",
+    "resource_id", "action", "status", "details_json",
+)
+
+
+class _AuditQueue:
+    """Background writer for deferred audit events.
+
+    Collects up to BATCH_SIZE events (or whatever arrives within MAX_WAIT
+    seconds) and inserts them with one executemany per database.
+    """
+
+    BATCH_SIZE = 256
+    MAX_WAIT = 0.1
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Tuple[SqliteData, Tuple[Any, ...]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def put(self, data: SqliteData, row: Tuple[Any, ...]) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="gryt-audit", daemon=True)
+                self._worker.start()
+                atexit.register(self.flush)
+        self._queue.put((data, row))
+
+    def flush(self) -> None:
+        """Block until every queued event has been written"""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.MAX_WAIT
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write(batch: List[Tuple[SqliteData, Tuple[Any, ...]]]) -> None:
+        rows_by_db: Dict[int, Tuple[SqliteData, List[Tuple[Any, ...]]]] = {}
+        for data, row in batch:
+            rows_by_db.setdefault(id(data), (data, []))[1].append(row)
+        for data, rows in rows_by_db.values():
+            try:
+                data.insert_many("audit_events", _AUDIT_COLUMNS, rows)
+            except Exception as e:
+                logger.error(f"Failed to write {len(rows)} audit event(s): {e}")
+
+
+_audit_queue = _AuditQueue()
+
+
 @dataclass
 class AuditEvent:
     """Represents a single audit event"""
@@ -87,6 +160,47 @@ class AuditTrail:
 
         return event_id
 
+    def log_event_async(
+        self,
+        event_type: str,
+        resource_type: str,
+        resource_id: str,
+        action: str,
+        status: str = "success",
+        actor: str = "system",
+        details: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Queue an audit event to be written in the background.
+
+        Returns immediately; events are batched into one insert. Pending events
+        are written before the database is closed or the process exits, or
+        sooner via flush().
+        """
+        import uuid
+
+        event_id = f"audit-{uuid.uuid4().hex[:12]}"
+        timestamp = datetime.now().isoformat()
+
+        self.data.call_on_close(_audit_queue.flush)
+        _audit_queue.put(self.data, (
+            event_id,
+            timestamp,
+            event_type,
+            actor,
+            resource_type,
+            resource_id,
+            action,
+            status,
+            json.dumps(details or {}),
+        ))
+
+        return event_id
+
+    @staticmethod
+    def flush() -> None:
+        """Wait until all events queued with log_event_async are written"""
+        _audit_queue.flush()
+
     def export_full_audit_trail(self, output_path: Path, format: str = "json") -> None:
         """Export complete audit trail to file
 
@@ -102,7 +102,8 @@ def cmd_run(script: str, parallel: bool = False, show: bool = False) -> int:
                 err=True,
             )
             return 2
-        results = pipeline.execute(parallel=parallel, show=show)
+        with pipeline:
+            results = pipeline.execute(parallel=parallel, show=show)
         
         # Check for failures in results and propagate non-zero exit codes
         exit_code = 0
@@ -176,9 +177,7 @@ def _ensure_gryt_structure(root: Path, force: bool = False) -> Path:
     # Create sqlite db file (and initialize schema)
     db_path = gryt_dir / DEFAULT_DB_RELATIVE
     try:
-        # Instantiate SqliteData to initialize predefined tables
-        data = SqliteData(db_path=str(db_path))
-        data.close()
+        SqliteData.initialize_schema_at(db_path)
     except Exception:
         # Fallback: touch file to ensure it exists
         conn = sqlite3.connect(str(db_path))
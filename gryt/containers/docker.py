@@ -104,7 +104,7 @@ class ContainerBuildStep(Step):
 
             stream = low.build(**build_params)
             # stream is a generator of dicts when decode=True; otherwise bytes
-            show = bool(getattr(self, "show", False))
+            show = self.show
             for chunk in stream:
                 if isinstance(chunk, (bytes, bytearray)):
                     # Best-effort decoding
@@ -166,7 +166,7 @@ class ContainerBuildStep(Step):
                         # client.images.push returns a string stream; use low-level for decode
                         for line in client.api.push(repository=t, stream=True, decode=True):
                             push_results.setdefault(t, []).append(line)
-                            if bool(getattr(self, "show", False)):
+                            if self.show:
                                 # Print status lines from push as they arrive
                                 text = line.get("status") or line.get("errorDetail", {}).get("message") or line.get("progressDetail")
                                 if text:
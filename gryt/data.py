@@ -4,8 +4,27 @@ import json
 import sqlite3
 import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# Connection tuning for short-lived CLI processes doing many small writes:
+# WAL lets readers and a writer proceed concurrently, synchronous=NORMAL drops
+# the extra fsync per commit (safe under WAL), and busy_timeout waits for a
+# competing gryt process instead of failing with "database is locked".
+PERFORMANCE_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Prepared statements kept per connection (sqlite3 default is 128); the
+# batched CLI paths reuse a handful of statements many times per command.
+CACHED_STATEMENTS = 256
 
 
 class Data(ABC):
@@ -20,6 +39,8 @@ class Data(ABC):
         self._db_path = ":memory:" if in_memory else str(db_path)
         self._conn: Optional[sqlite3.Connection] = None
         self._lock = threading.RLock()
+        self._tx_depth = 0
+        self._close_callbacks: List[Callable[[], None]] = []
         self.connect()
 
     @property
@@ -29,7 +50,9 @@ class Data(ABC):
 
     def connect(self) -> None:
         with self._lock:
-            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn = sqlite3.connect(
+                self._db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS
+            )
             self._conn.row_factory = sqlite3.Row
         # Initialize predefined tables on first connect
         self._init_tables()
@@ -50,7 +73,17 @@ class Data(ABC):
     def update(self, table_name: str, data: Dict[str, Any], where: str, params: Tuple[Any, ...]) -> None:
         """Update rows matching the where clause with params."""
 
+    def call_on_close(self, callback: Callable[[], None]) -> None:
+        """Run callback just before the connection closes (e.g. to flush deferred writes)."""
+        if callback not in self._close_callbacks:
+            self._close_callbacks.append(callback)
+
     def close(self) -> None:
+        # Callbacks run outside the lock so they can still use the connection
+        # from other threads (a background writer draining its queue)
+        callbacks, self._close_callbacks = self._close_callbacks, []
+        for callback in callbacks:
+            callback()
         with self._lock:
             if self._conn is not None:
                 self._conn.close()
@@ -63,57 +96,101 @@ class SqliteData(Data):
     Thread-safe via a re-entrant lock around connection operations.
     """
 
+    @classmethod
+    def initialize_schema_at(cls, db_path: Path | str) -> None:
+        """Create (or migrate) the database at db_path and close it again."""
+        cls(db_path=db_path).close()
+
     def _init_tables(self) -> None:
         """Create predefined tables used by gryt primitives.
         - pipelines, runners, steps_output, versions
         """
         with self._lock:
-            # Ensure foreign keys are enforced
+            # Ensure foreign keys are enforced (a no-op inside a transaction, so set it first)
             self.conn.execute("PRAGMA foreign_keys = ON")
-            # pipelines
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS pipelines (
-                    pipeline_id TEXT PRIMARY KEY,
-                    name TEXT,
-                    start_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    end_timestamp DATETIME,
-                    status TEXT,
-                    config_json TEXT
-                )
-                """
+            # Run the DDL in one transaction: a fresh file is written and synced
+            # once instead of once per CREATE TABLE
+            self.conn.execute("BEGIN")
+            try:
+                self._create_tables()
+            except BaseException:
+                # Leave the connection outside any transaction if a migration fails
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+
+    def _create_tables(self) -> None:
+        """Create tables and apply migrations; runs inside _init_tables' transaction."""
+        # pipelines
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pipelines (
+                pipeline_id TEXT PRIMARY KEY,
+                name TEXT,
+                start_timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                end_timestamp DATETIME,
+                status TEXT,
+                config_json TEXT
+            )
+            """
+        )
+        # runners
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS runners (
+                runner_id TEXT PRIMARY KEY,
+                pipeline_id TEXT,
+                name TEXT,
+                execution_order INTEGER,
+                status TEXT,
+                FOREIGN KEY (pipeline_id) REFERENCES pipelines(pipeline_id) ON DELETE CASCADE
             )
-            # runners
+            """
+        )
+        # steps_output: ensure schema supports multiple records per step (history)
+        # Target schema:
+        # output_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        # step_id TEXT,
+        # runner_id TEXT,
+        # name TEXT,
+        # output_json TEXT,
+        # status TEXT,
+        # duration REAL,
+        # timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        # FOREIGN KEY (runner_id) REFERENCES runners(runner_id) ON DELETE CASCADE
+        # Create if missing, otherwise migrate if old schema found
+        cur = self.conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='steps_output'")
+        exists = cur.fetchone() is not None
+        if not exists:
             self.conn.execute(
                 """
-                CREATE TABLE IF NOT EXISTS runners (
-                    runner_id TEXT PRIMARY KEY,
-                    pipeline_id TEXT,
+                CREATE TABLE steps_output (
+                    output_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    step_id TEXT,
+                    runner_id TEXT,
                     name TEXT,
-                    execution_order INTEGER,
+                    output_json TEXT,
+                    stdout TEXT,
+                    stderr TEXT,
                     status TEXT,
-                    FOREIGN KEY (pipeline_id) REFERENCES pipelines(pipeline_id) ON DELETE CASCADE
+                    duration REAL,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (runner_id) REFERENCES runners(runner_id) ON DELETE CASCADE
                 )
                 """
             )
-            # steps_output: ensure schema supports multiple records per step (history)
-            # Target schema:
-            # output_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            # step_id TEXT,
-            # runner_id TEXT,
-            # name TEXT,
-            # output_json TEXT,
-            # status TEXT,
-            # duration REAL,
-            # timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-            # FOREIGN KEY (runner_id) REFERENCES runners(runner_id) ON DELETE CASCADE
-            # Create if missing, otherwise migrate if old schema found
-            cur = self.conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='steps_output'")
-            exists = cur.fetchone() is not None
-            if not exists:
+        else:
+            # Detect old schema lacking output_id or having PRIMARY KEY on step_id
+            info = self.conn.execute("PRAGMA table_info(steps_output)").fetchall()
+            cols = {row["name"]: row for row in info}
+            has_output_id = "output_id" in cols
+            # sqlite3.Row does not support .get(); use index access by column name
+            step_id_is_pk = bool(cols["step_id"]["pk"]) if "step_id" in cols else False
+            if (not has_output_id) or step_id_is_pk:
+                # Perform migration: create new table, copy data, drop old, rename
                 self.conn.execute(
                     """
-                    CREATE TABLE steps_output (
+                    CREATE TABLE IF NOT EXISTS steps_output_new (
                         output_id INTEGER PRIMARY KEY AUTOINCREMENT,
                         step_id TEXT,
                         runner_id TEXT,
@@ -128,244 +205,235 @@ class SqliteData(Data):
                     )
                     """
                 )
-            else:
-                # Detect old schema lacking output_id or having PRIMARY KEY on step_id
-                info = self.conn.execute("PRAGMA table_info(steps_output)").fetchall()
-                cols = {row["name"]: row for row in info}
-                has_output_id = "output_id" in cols
-                # sqlite3.Row does not support .get(); use index access by column name
-                step_id_is_pk = bool(cols["step_id"]["pk"]) if "step_id" in cols else False
-                if (not has_output_id) or step_id_is_pk:
-                    # Perform migration: create new table, copy data, drop old, rename
-                    self.conn.execute(
-                        """
-                        CREATE TABLE IF NOT EXISTS steps_output_new (
-                            output_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            step_id TEXT,
-                            runner_id TEXT,
-                            name TEXT,
-                            output_json TEXT,
-                            stdout TEXT,
-                            stderr TEXT,
-                            status TEXT,
-                            duration REAL,
-                            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                            FOREIGN KEY (runner_id) REFERENCES runners(runner_id) ON DELETE CASCADE
-                        )
-                        """
-                    )
-                    # Copy data from old table into new table (output_id will autogenerate)
-                    self.conn.execute(
-                        """
-                        INSERT INTO steps_output_new (step_id, runner_id, name, output_json, status, duration, timestamp)
-                        SELECT step_id, runner_id, name, output_json, status, duration, timestamp FROM steps_output
-                        """
-                    )
-                    self.conn.execute("DROP TABLE steps_output")
-                    self.conn.execute("ALTER TABLE steps_output_new RENAME TO steps_output")
-                # Ensure stdout/stderr columns exist on current table
-                info2 = self.conn.execute("PRAGMA table_info(steps_output)").fetchall()
-                cols2 = {row[1] if isinstance(row, tuple) else row["name"]: row for row in info2}
-                if "stdout" not in cols2:
-                    self.conn.execute("ALTER TABLE steps_output ADD COLUMN stdout TEXT")
-                    try:
-                        getattr(self, "_last_migrations_applied", []).append("add steps_output.stdout column")
-                    except Exception:
-                        pass
-                if "stderr" not in cols2:
-                    self.conn.execute("ALTER TABLE steps_output ADD COLUMN stderr TEXT")
-                    try:
-                        getattr(self, "_last_migrations_applied", []).append("add steps_output.stderr column")
-                    except Exception:
-                        pass
-            # versions
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS versions (
-                    version_id TEXT PRIMARY KEY,
-                    app_name TEXT,
-                    version_string TEXT,
-                    commit_hash TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
-            # generations (v0.2.0)
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS generations (
-                    generation_id TEXT PRIMARY KEY,
-                    version TEXT UNIQUE NOT NULL,
-                    description TEXT,
-                    status TEXT DEFAULT 'draft',
-                    pipeline_template TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    promoted_at DATETIME,
-                    created_by TEXT,
-                    promoted_by TEXT,
-                    sync_status TEXT DEFAULT 'not_synced',
-                    remote_id TEXT,
-                    last_synced_at DATETIME
+                # Copy data from old table into new table (output_id will autogenerate)
+                self.conn.execute(
+                    """
+                    INSERT INTO steps_output_new (step_id, runner_id, name, output_json, status, duration, timestamp)
+                    SELECT step_id, runner_id, name, output_json, status, duration, timestamp FROM steps_output
+                    """
                 )
-                """
-            )
-            # Migrate: Add user tracking fields if missing (v1.0.0)
-            gen_info = self.conn.execute("PRAGMA table_info(generations)").fetchall()
-            gen_cols = {row[1] if isinstance(row, tuple) else row["name"]: row for row in gen_info}
-            if "created_by" not in gen_cols:
-                self.conn.execute("ALTER TABLE generations ADD COLUMN created_by TEXT")
-                try:
-                    getattr(self, "_last_migrations_applied", []).append("add generations.created_by column")
-                except Exception:
-                    pass
-            if "promoted_by" not in gen_cols:
-                self.conn.execute("ALTER TABLE generations ADD COLUMN promoted_by TEXT")
+                self.conn.execute("DROP TABLE steps_output")
+                self.conn.execute("ALTER TABLE steps_output_new RENAME TO steps_output")
+            # Ensure stdout/stderr columns exist on current table
+            info2 = self.conn.execute("PRAGMA table_info(steps_output)").fetchall()
+            cols2 = {row[1] if isinstance(row, tuple) else row["name"]: row for row in info2}
+            if "stdout" not in cols2:
+                self.conn.execute("ALTER TABLE steps_output ADD COLUMN stdout TEXT")
                 try:
-                    getattr(self, "_last_migrations_applied", []).append("add generations.promoted_by column")
+                    getattr(self, "_last_migrations_applied", []).append("add steps_output.stdout column")
                 except Exception:
                     pass
-            if "team_id" not in gen_cols:
-                self.conn.execute("ALTER TABLE generations ADD COLUMN team_id TEXT")
+            if "stderr" not in cols2:
+                self.conn.execute("ALTER TABLE steps_output ADD COLUMN stderr TEXT")
                 try:
-                    getattr(self, "_last_migrations_applied", []).append("add generations.team_id column")
+                    getattr(self, "_last_migrations_applied", []).append("add steps_output.stderr column")
                 except Exception:
                     pass
-            # generation_changes (v0.2.0)
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS generation_changes (
-                    change_id TEXT PRIMARY KEY,
-                    generation_id TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    status TEXT DEFAULT 'pending',
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (generation_id) REFERENCES generations(generation_id) ON DELETE CASCADE
-                )
-                """
+        # versions
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS versions (
+                version_id TEXT PRIMARY KEY,
+                app_name TEXT,
+                version_string TEXT,
+                commit_hash TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
             )
-            # Migrate: Add pipeline field if missing (v1.0.4)
-            changes_info = self.conn.execute("PRAGMA table_info(generation_changes)").fetchall()
-            changes_cols = {row[1] if isinstance(row, tuple) else row["name"]: row for row in changes_info}
-            if "pipeline" not in changes_cols:
-                self.conn.execute("ALTER TABLE generation_changes ADD COLUMN pipeline TEXT")
-                try:
-                    getattr(self, "_last_migrations_applied", []).append("add generation_changes.pipeline column")
-                except Exception:
-                    pass
-            # evolutions (v0.3.0)
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS evolutions (
-                    evolution_id TEXT PRIMARY KEY,
-                    generation_id TEXT NOT NULL,
-                    change_id TEXT NOT NULL,
-                    code_name TEXT UNIQUE NOT NULL,
-                    tag TEXT,
-                    status TEXT DEFAULT 'pending',
-                    pipeline_run_id TEXT,
-                    started_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    completed_at DATETIME,
-                    created_by TEXT,
-                    sync_status TEXT DEFAULT 'not_synced',
-                    remote_id TEXT,
-                    last_synced_at DATETIME,
-                    FOREIGN KEY (generation_id) REFERENCES generations(generation_id) ON DELETE CASCADE,
-                    FOREIGN KEY (change_id) REFERENCES generation_changes(change_id) ON DELETE CASCADE,
-                    FOREIGN KEY (pipeline_run_id) REFERENCES pipelines(pipeline_id) ON DELETE SET NULL
-                )
-                """
+            """
+        )
+        # generations (v0.2.0)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS generations (
+                generation_id TEXT PRIMARY KEY,
+                version TEXT UNIQUE NOT NULL,
+                description TEXT,
+                status TEXT DEFAULT 'draft',
+                pipeline_template TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                promoted_at DATETIME,
+                created_by TEXT,
+                promoted_by TEXT,
+                sync_status TEXT DEFAULT 'not_synced',
+                remote_id TEXT,
+                last_synced_at DATETIME
             )
-            # Migrate: Add user tracking field if missing (v1.0.0)
-            evo_info = self.conn.execute("PRAGMA table_info(evolutions)").fetchall()
-            evo_cols = {row[1] if isinstance(row, tuple) else row["name"]: row for row in evo_info}
-            if "created_by" not in evo_cols:
-                self.conn.execute("ALTER TABLE evolutions ADD COLUMN created_by TEXT")
-                try:
-                    getattr(self, "_last_migrations_applied", []).append("add evolutions.created_by column")
-                except Exception:
-                    pass
-            # Migrate: Add code_name column if missing (v1.1.3)
-            if "code_name" not in evo_cols:
-                # Add code_name column
-                self.conn.execute("ALTER TABLE evolutions ADD COLUMN code_name TEXT")
-                try:
-                    getattr(self, "_last_migrations_applied", []).append("add evolutions.code_name column")
-                except Exception:
-                    pass
-                # Generate code names for existing evolutions
-                from .codename import generate_code_name
-                existing_evos = self.conn.execute("SELECT evolution_id FROM evolutions WHERE code_name IS NULL").fetchall()
-                for evo in existing_evos:
+            """
+        )
+        # Migrate: Add user tracking fields if missing (v1.0.0)
+        gen_info = self.conn.execute("PRAGMA table_info(generations)").fetchall()
+        gen_cols = {row[1] if isinstance(row, tuple) else row["name"]: row for row in gen_info}
+        if "created_by" not in gen_cols:
+            self.conn.execute("ALTER TABLE generations ADD COLUMN created_by TEXT")
+            try:
+                getattr(self, "_last_migrations_applied", []).append("add generations.created_by column")
+            except Exception:
+                pass
+        if "promoted_by" not in gen_cols:
+            self.conn.execute("ALTER TABLE generations ADD COLUMN promoted_by TEXT")
+            try:
+                getattr(self, "_last_migrations_applied", []).append("add generations.promoted_by column")
+            except Exception:
+                pass
+        if "team_id" not in gen_cols:
+            self.conn.execute("ALTER TABLE generations ADD COLUMN team_id TEXT")
+            try:
+                getattr(self, "_last_migrations_applied", []).append("add generations.team_id column")
+            except Exception:
+                pass
+        # Migrate: YAML mtime (ns) recorded by `generation update` to skip unchanged files
+        if "yaml_mtime" not in gen_cols:
+            self.conn.execute("ALTER TABLE generations ADD COLUMN yaml_mtime INTEGER")
+            try:
+                getattr(self, "_last_migrations_applied", []).append("add generations.yaml_mtime column")
+            except Exception:
+                pass
+        # Migrate: hot-fix flag, indexed so list_hotfixes avoids a LIKE scan of versions
+        if "is_hotfix" not in gen_cols:
+            self.conn.execute("ALTER TABLE generations ADD COLUMN is_hotfix INTEGER NOT NULL DEFAULT 0")
+            # Backfill generations created by HotfixWorkflow before the flag existed
+            self.conn.execute("UPDATE generations SET is_hotfix = 1 WHERE description LIKE 'Hot-fix for %'")
+            try:
+                getattr(self, "_last_migrations_applied", []).append("add generations.is_hotfix column")
+            except Exception:
+                pass
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_generations_hotfix ON generations(is_hotfix, created_at DESC)"
+        )
+        # generation_changes (v0.2.0)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS generation_changes (
+                change_id TEXT PRIMARY KEY,
+                generation_id TEXT NOT NULL,
+                type TEXT NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT,
+                status TEXT DEFAULT 'pending',
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (generation_id) REFERENCES generations(generation_id) ON DELETE CASCADE
+            )
+            """
+        )
+        # Migrate: Add pipeline field if missing (v1.0.4)
+        changes_info = self.conn.execute("PRAGMA table_info(generation_changes)").fetchall()
+        changes_cols = {row[1] if isinstance(row, tuple) else row["name"]: row for row in changes_info}
+        if "pipeline" not in changes_cols:
+            self.conn.execute("ALTER TABLE generation_changes ADD COLUMN pipeline TEXT")
+            try:
+                getattr(self, "_last_migrations_applied", []).append("add generation_changes.pipeline column")
+            except Exception:
+                pass
+        # evolutions (v0.3.0)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evolutions (
+                evolution_id TEXT PRIMARY KEY,
+                generation_id TEXT NOT NULL,
+                change_id TEXT NOT NULL,
+                code_name TEXT UNIQUE NOT NULL,
+                tag TEXT,
+                status TEXT DEFAULT 'pending',
+                pipeline_run_id TEXT,
+                started_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                completed_at DATETIME,
+                created_by TEXT,
+                sync_status TEXT DEFAULT 'not_synced',
+                remote_id TEXT,
+                last_synced_at DATETIME,
+                FOREIGN KEY (generation_id) REFERENCES generations(generation_id) ON DELETE CASCADE,
+                FOREIGN KEY (change_id) REFERENCES generation_changes(change_id) ON DELETE CASCADE,
+                FOREIGN KEY (pipeline_run_id) REFERENCES pipelines(pipeline_id) ON DELETE SET NULL
+            )
+            """
+        )
+        # Migrate: Add user tracking field if missing (v1.0.0)
+        evo_info = self.conn.execute("PRAGMA table_info(evolutions)").fetchall()
+        evo_cols = {row[1] if isinstance(row, tuple) else row["name"]: row for row in evo_info}
+        if "created_by" not in evo_cols:
+            self.conn.execute("ALTER TABLE evolutions ADD COLUMN created_by TEXT")
+            try:
+                getattr(self, "_last_migrations_applied", []).append("add evolutions.created_by column")
+            except Exception:
+                pass
+        # Migrate: Add code_name column if missing (v1.1.3)
+        if "code_name" not in evo_cols:
+            # Add code_name column
+            self.conn.execute("ALTER TABLE evolutions ADD COLUMN code_name TEXT")
+            try:
+                getattr(self, "_last_migrations_applied", []).append("add evolutions.code_name column")
+            except Exception:
+                pass
+            # Generate code names for existing evolutions
+            from .codename import generate_code_name
+            existing_evos = self.conn.execute("SELECT evolution_id FROM evolutions WHERE code_name IS NULL").fetchall()
+            for evo in existing_evos:
+                code_name = generate_code_name()
+                # Ensure uniqueness
+                while self.conn.execute("SELECT 1 FROM evolutions WHERE code_name = ?", (code_name,)).fetchone():
                     code_name = generate_code_name()
-                    # Ensure uniqueness
-                    while self.conn.execute("SELECT 1 FROM evolutions WHERE code_name = ?", (code_name,)).fetchone():
-                        code_name = generate_code_name()
-                    self.conn.execute(
-                        "UPDATE evolutions SET code_name = ? WHERE evolution_id = ?",
-                        (code_name, evo[0])
-                    )
-                self.conn.commit()
-            # Migrate: Make tag nullable (v1.1.3)
-            # SQLite doesn't support ALTER COLUMN, so we check if tag is NOT NULL in existing rows
-            # New schema has tag as nullable, old evolutions will keep their tags
-            # sync_metadata (v1.0.0 - distributed sync)
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS sync_metadata (
-                    key TEXT PRIMARY KEY,
-                    value TEXT,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                self.conn.execute(
+                    "UPDATE evolutions SET code_name = ? WHERE evolution_id = ?",
+                    (code_name, evo[0])
                 )
-                """
+        # Migrate: Make tag nullable (v1.1.3)
+        # SQLite doesn't support ALTER COLUMN, so we check if tag is NOT NULL in existing rows
+        # New schema has tag as nullable, old evolutions will keep their tags
+        # sync_metadata (v1.0.0 - distributed sync)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
-            # audit_events (v1.0.0 - audit trail)
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS audit_events (
-                    event_id TEXT PRIMARY KEY,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    event_type TEXT NOT NULL,
-                    resource_type TEXT NOT NULL,
-                    resource_id TEXT NOT NULL,
-                    action TEXT NOT NULL,
-                    status TEXT DEFAULT 'success',
-                    actor TEXT DEFAULT 'system',
-                    details_json TEXT
-                )
-                """
+            """
+        )
+        # audit_events (v1.0.0 - audit trail)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS audit_events (
+                event_id TEXT PRIMARY KEY,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                event_type TEXT NOT NULL,
+                resource_type TEXT NOT NULL,
+                resource_id TEXT NOT NULL,
+                action TEXT NOT NULL,
+                status TEXT DEFAULT 'success',
+                actor TEXT DEFAULT 'system',
+                details_json TEXT
             )
-            # change_pipelines (v1.0.10 - multiple pipelines per change)
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS change_pipelines (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    change_id TEXT NOT NULL,
-                    generation_id TEXT NOT NULL,
-                    pipeline_name TEXT NOT NULL,
-                    is_primary INTEGER DEFAULT 0,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    created_by TEXT,
-                    FOREIGN KEY (change_id) REFERENCES generation_changes(change_id) ON DELETE CASCADE,
-                    FOREIGN KEY (generation_id) REFERENCES generations(generation_id) ON DELETE CASCADE,
-                    UNIQUE(change_id, generation_id, pipeline_name)
-                )
-                """
+            """
+        )
+        # change_pipelines (v1.0.10 - multiple pipelines per change)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS change_pipelines (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                change_id TEXT NOT NULL,
+                generation_id TEXT NOT NULL,
+                pipeline_name TEXT NOT NULL,
+                is_primary INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                created_by TEXT,
+                FOREIGN KEY (change_id) REFERENCES generation_changes(change_id) ON DELETE CASCADE,
+                FOREIGN KEY (generation_id) REFERENCES generations(generation_id) ON DELETE CASCADE,
+                UNIQUE(change_id, generation_id, pipeline_name)
             )
-            # auth_output (v1.2.0 - authentication tracking)
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS auth_output (
-                    auth_id TEXT PRIMARY KEY,
-                    type TEXT NOT NULL,
-                    output_json TEXT,
-                    status TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-                """
+            """
+        )
+        # auth_output (v1.2.0 - authentication tracking)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS auth_output (
+                auth_id TEXT PRIMARY KEY,
+                type TEXT NOT NULL,
+                output_json TEXT,
+                status TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
             )
-            self.conn.commit()
+            """
+        )
 
     def _jsonify(self, value: Any) -> Any:
         if isinstance(value, (dict, list)):
@@ -395,7 +463,27 @@ class SqliteData(Data):
                 f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})",
                 tuple(data2.values()),
             )
-            self.conn.commit()
+            self._autocommit()
+
+    def insert_many(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        rows: Iterable[Tuple[Any, ...]],
+        or_ignore: bool = False,
+    ) -> None:
+        """Insert many rows (tuples ordered as `columns`) with one prepared statement.
+
+        Like insert(), dict/list values are JSON-serialized and the write is
+        committed unless inside transaction(). or_ignore skips conflicting rows.
+        """
+        verb = "INSERT OR IGNORE" if or_ignore else "INSERT"
+        placeholders = ", ".join(["?"] * len(columns))
+        sql = f"{verb} INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        jsonify = self._jsonify
+        with self._lock:
+            self.conn.executemany(sql, (tuple(jsonify(v) for v in row) for row in rows))
+            self._autocommit()
 
     def query(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Dict[str, Any]]:
         with self._lock:
@@ -407,6 +495,20 @@ class SqliteData(Data):
             results.append({k: self._dejsonify(v) for k, v in d.items()})
         return results
 
+    def query_rows(self, sql: str, params: Tuple[Any, ...] = ()) -> List[sqlite3.Row]:
+        """Execute a SELECT and return raw sqlite3.Row objects.
+
+        Skips the per-row dict copy and JSON parsing done by query(); rows
+        support both name (row["col"]) and positional access/unpacking.
+        """
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Tuple[Any, ...] = ()) -> Optional[sqlite3.Row]:
+        """Execute a SELECT and return only the first raw row (or None)."""
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()
+
     def update(self, table_name: str, data: Dict[str, Any], where: str, params: Tuple[Any, ...]) -> None:
         data2 = {k: self._jsonify(v) for k, v in data.items()}
         set_clause = ", ".join(f"{k} = ?" for k in data2.keys())
@@ -415,18 +517,63 @@ class SqliteData(Data):
                 f"UPDATE {table_name} SET {set_clause} WHERE {where}",
                 tuple(data2.values()) + params,
             )
-            self.conn.commit()
+            self._autocommit()
 
     def execute(self, sql: str, params: Tuple[Any, ...] = ()) -> None:
         """Execute arbitrary SQL statement (UPDATE, DELETE, etc.) without returning results."""
         with self._lock:
             self.conn.execute(sql, params)
 
+    def apply_performance_pragmas(self) -> None:
+        """Apply PERFORMANCE_PRAGMAS to the open connection (idempotent).
+
+        Best-effort: a pragma the database rejects (e.g. WAL on a read-only
+        filesystem) is skipped and the connection keeps SQLite's default.
+        """
+        with self._lock:
+            for pragma in PERFORMANCE_PRAGMAS:
+                try:
+                    self.conn.execute(pragma)
+                except sqlite3.OperationalError:
+                    pass
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Tuple[Any, ...]]) -> None:
+        """Execute a statement once per params tuple (batched inserts/updates) without committing."""
+        with self._lock:
+            self.conn.executemany(sql, seq_of_params)
+
     def commit(self) -> None:
         """Commit pending transactions."""
         with self._lock:
             self.conn.commit()
 
+    @contextmanager
+    def transaction(self) -> Iterator[SqliteData]:
+        """Group writes into a single transaction.
+
+        insert()/update() skip their per-call commit while inside the block; the
+        whole block is committed on exit or rolled back on error. Nested blocks
+        join the outermost transaction.
+        """
+        with self._lock:
+            if self._tx_depth == 0 and not self.conn.in_transaction:
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.rollback()
+                raise
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self.conn.commit()
+
+    def _autocommit(self) -> None:
+        if self._tx_depth == 0:
+            self.conn.commit()
+
     def migrate(self) -> Dict[str, Any]:
         """
         Run schema migrations (idempotent). Returns a report of applied migrations.
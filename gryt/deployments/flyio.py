@@ -128,7 +128,7 @@ class FlyDeployStep(Step):
             data=self.data,
         )
         try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
+            _cs.show = self.show
         except Exception:
             pass
         return _cs.run()
@@ -6,9 +6,12 @@ Used to trigger cloud sync, hooks, notifications, etc.
 """
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from collections import defaultdict
+import atexit
 import logging
+import queue
+import threading
 
 
 logger = logging.getLogger(__name__)
@@ -43,6 +46,10 @@ class EventBus:
 
     def __init__(self):
         self._handlers: Dict[str, List[EventHandler]] = defaultdict(list)
+        self._queue: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._atexit_registered = False
 
     def subscribe(self, event_name: str, handler: EventHandler) -> None:
         """Subscribe a handler to an event"""
@@ -67,6 +74,38 @@ class EventBus:
             except Exception as e:
                 logger.error(f"Error in event handler for {event_name}: {e}")
 
+    def emit_async(self, event_name: str, payload: Dict[str, Any]) -> None:
+        """Queue an event for delivery on a background thread.
+
+        Handlers run in emission order off the caller's thread. Pending events
+        are delivered before interpreter exit; call flush() to wait sooner.
+        """
+        self._ensure_worker()
+        self._queue.put((event_name, payload))
+
+    def flush(self) -> None:
+        """Block until every event queued with emit_async has been handled"""
+        self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="gryt-event-bus", daemon=True
+                )
+                self._worker.start()
+                if not self._atexit_registered:
+                    atexit.register(self.flush)
+                    self._atexit_registered = True
+
+    def _run_worker(self) -> None:
+        while True:
+            event_name, payload = self._queue.get()
+            try:
+                self.emit(event_name, payload)
+            finally:
+                self._queue.task_done()
+
     def clear(self) -> None:
         """Clear all subscriptions (useful for testing)"""
         self._handlers.clear()
@@ -42,7 +42,9 @@ def _get_db() -> SqliteData:
             err=True,
         )
         raise typer.Exit(2)
-    return SqliteData(db_path=str(db_path))
+    data = SqliteData(db_path=str(db_path))
+    data.apply_performance_pragmas()
+    return data
 
 
 def cmd_evolution_start(
@@ -342,7 +344,8 @@ def cmd_evolution_prove(evolution_id: str, pipeline_filter: Optional[str] = None
                 if pipeline.data is None:
                     pipeline.data = data
 
-                results = pipeline.execute(parallel=parallel, show=show)
+                with pipeline:
+                    results = pipeline.execute(parallel=parallel, show=show)
 
                 # Determine success/failure for this pipeline
                 pipeline_exit_code = 0
@@ -5,21 +5,132 @@ A Generation is a release contract that declares what a version MUST contain.
 """
 from __future__ import annotations
 
-import json
+import re
+import sqlite3
 import subprocess
 import uuid
-import yaml
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .data import SqliteData
 from .events import get_event_bus
 
+try:  # optional faster JSON parser
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+@lru_cache(maxsize=None)
+def _yaml_safe_io() -> tuple:
+    """Import PyYAML on first use and return (yaml, SafeLoader, SafeDumper).
+
+    Prefers the libyaml-backed C loader/dumper; falls back to pure Python.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as dumper, CSafeLoader as loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper as dumper, SafeLoader as loader
+    return yaml, loader, dumper
+
+
+# Recurring SQL kept as module constants. sqlite3 caches prepared statements
+# per connection keyed on the SQL text, so reusing these exact strings skips
+# re-parsing and re-planning on repeated calls.
+_SQL_GENERATION_EXISTS = "SELECT 1 FROM generations WHERE generation_id = ? LIMIT 1"
+_SQL_INSERT_CHANGE = (
+    "INSERT OR IGNORE INTO generation_changes "
+    "(change_id, generation_id, type, title, description, status, pipeline) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_GENERATION_SUMMARIES = """
+    SELECT g.version, g.status, g.sync_status, g.team_id, g.description,
+           COUNT(c.change_id) AS change_count
+    FROM generations g
+    LEFT JOIN generation_changes c ON c.generation_id = g.generation_id
+    GROUP BY g.generation_id
+    ORDER BY g.created_at DESC
+"""
+_SQL_GENERATIONS_WITH_CHANGES = """
+    SELECT g.*,
+           c.change_id AS c_change_id,
+           c.type AS c_type,
+           c.title AS c_title,
+           c.description AS c_description,
+           c.status AS c_status,
+           c.pipeline AS c_pipeline
+    FROM generations g
+    LEFT JOIN generation_changes c ON c.generation_id = g.generation_id
+    {where}
+    ORDER BY g.created_at DESC, g.generation_id, c.created_at
+"""
+_SQL_CHANGE_PIPELINES = """
+    SELECT p.change_id, p.generation_id, p.pipeline_name, p.is_primary, p.created_by
+    FROM change_pipelines p
+    JOIN generations g ON g.generation_id = p.generation_id
+    {where}
+    ORDER BY p.is_primary DESC, p.pipeline_name
+"""
+_WHERE_GENERATION_ID = "WHERE g.generation_id = ?"
+_WHERE_VERSION = "WHERE g.version = ?"
+_WHERE_HOTFIX = "WHERE g.is_hotfix = 1"
+
+# Parsed and validated generation YAML keyed by resolved path, stored with the
+# file's (mtime_ns, size) so an edited file is re-read. Generation objects are
+# rebuilt from the cached dict on every call because callers mutate them.
+_YAML_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+# Mirrors schemas/generation.json for the fast validation path
+_VERSION_RE = re.compile(r"v?[0-9]+\.[0-9]+\.[0-9]+")
+_CHANGE_ID_RE = re.compile(r"[A-Z]+-[0-9]+")
+_CHANGE_TYPES = frozenset({"fix", "refine", "add", "remove"})
+
+
+def _is_valid_generation(data: Any) -> bool:
+    """Hand-written check equivalent to schemas/generation.json.
+
+    Returns True only when `data` certainly satisfies the schema, so the
+    common case never loads or evaluates jsonschema. Anything else falls
+    through to full schema validation, which produces the detailed error.
+    """
+    if not isinstance(data, dict):
+        return False
+    version = data.get("version")
+    changes = data.get("changes")
+    if not isinstance(version, str) or not _VERSION_RE.fullmatch(version):
+        return False
+    if not isinstance(changes, list) or not changes:
+        return False
+    for key in ("description", "pipeline_template"):
+        if key in data and not isinstance(data[key], str):
+            return False
+    for change in changes:
+        if not isinstance(change, dict):
+            return False
+        change_type = change.get("type")
+        change_id = change.get("id")
+        title = change.get("title")
+        if not isinstance(change_type, str) or change_type not in _CHANGE_TYPES:
+            return False
+        if not isinstance(change_id, str) or not _CHANGE_ID_RE.fullmatch(change_id):
+            return False
+        if not isinstance(title, str) or not title:
+            return False
+        if "description" in change and not isinstance(change["description"], str):
+            return False
+    return True
+
 
 class GenerationChange:
     """A single change within a Generation (Fix/Refine/Add/Remove)"""
 
+    __slots__ = ("change_id", "type", "title", "description", "status", "pipeline", "pipelines")
+
     def __init__(
         self,
         change_id: str,
@@ -80,8 +191,28 @@ class Generation:
         sync_status: not_synced|syncing|synced|conflict
         remote_id: ID in cloud (if synced)
         team_id: ID of team generation will be linked to
+        is_hotfix: True for generations created by the hot-fix workflow
     """
 
+    __slots__ = (
+        "generation_id",
+        "version",
+        "description",
+        "changes",
+        "pipeline_template",
+        "status",
+        "sync_status",
+        "created_by",
+        "promoted_by",
+        "team_id",
+        "is_hotfix",
+        "remote_id",
+        "_created_at",
+        "_created_at_iso",
+        "_promoted_at",
+        "_promoted_at_iso",
+    )
+
     def __init__(
         self,
         version: str,
@@ -97,6 +228,7 @@ class Generation:
         created_by: Optional[str] = None,
         promoted_by: Optional[str] = None,
         team_id: Optional[str] = None,
+        is_hotfix: bool = False,
     ):
         self.generation_id = generation_id or str(uuid.uuid4())
         self.version = version if version.startswith("v") else f"v{version}"
@@ -108,18 +240,46 @@ class Generation:
         self.created_by = created_by
         self.promoted_by = promoted_by
         self.team_id = team_id
+        self.is_hotfix = is_hotfix
         self.remote_id = remote_id
         self.created_at = created_at or datetime.now()
         self.promoted_at = promoted_at
 
+    # Timestamps keep their ISO form alongside so to_dict() (called for every
+    # emitted event and sync payload) doesn't re-format them on each call.
+    @property
+    def created_at(self) -> Optional[datetime]:
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, value: Optional[datetime]) -> None:
+        self._created_at = value
+        self._created_at_iso = value.isoformat() if value else None
+
+    @property
+    def promoted_at(self) -> Optional[datetime]:
+        return self._promoted_at
+
+    @promoted_at.setter
+    def promoted_at(self, value: Optional[datetime]) -> None:
+        self._promoted_at = value
+        self._promoted_at_iso = value.isoformat() if value else None
+
     @classmethod
     def from_yaml_file(cls, yaml_path: Path) -> Generation:
         """Load a Generation from a YAML file"""
-        with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+        path = Path(yaml_path).resolve()
+        stat = path.stat()
+        cached = _YAML_CACHE.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            data = cached[2]
+        else:
+            yaml, loader, _ = _yaml_safe_io()
+            data = yaml.load(path.read_bytes(), Loader=loader)
 
-        # Validate against JSON schema
-        cls._validate_schema(data)
+            # Validate against JSON schema
+            cls._validate_schema(data)
+            _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
 
         changes = [GenerationChange.from_dict(c) for c in data["changes"]]
         return cls(
@@ -132,69 +292,21 @@ class Generation:
     @classmethod
     def from_db(cls, data: SqliteData, generation_id: str) -> Optional[Generation]:
         """Load a Generation from the database"""
-        from datetime import datetime
-
-        rows = data.query(
-            "SELECT * FROM generations WHERE generation_id = ?", (generation_id,)
-        )
-        if not rows:
-            return None
-
-        row = rows[0]
-        changes_rows = data.query(
-            "SELECT * FROM generation_changes WHERE generation_id = ? ORDER BY created_at",
-            (generation_id,),
-        )
-
-        # Debug: Log what we're loading from DB
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Loading {len(changes_rows)} changes for generation {generation_id}")
-        for c in changes_rows:
-            logger.info(f"  DB row: change_id={c['change_id']}, pipeline={c.get('pipeline')}")
-
-        changes = []
-        for c in changes_rows:
-            # Load linked pipelines from change_pipelines table
-            pipelines_rows = data.query(
-                "SELECT pipeline_name, is_primary, created_by, created_at FROM change_pipelines WHERE change_id = ? AND generation_id = ? ORDER BY is_primary DESC, pipeline_name",
-                (c["change_id"], generation_id),
-            )
-
-            pipelines_list = [
-                {
-                    "pipeline_name": p["pipeline_name"],
-                    "is_primary": bool(p["is_primary"]),
-                    "created_by": p.get("created_by"),
-                }
-                for p in pipelines_rows
-            ]
-
-            changes.append(
-                GenerationChange(
-                    change_id=c["change_id"],
-                    change_type=c["type"],
-                    title=c["title"],
-                    description=c.get("description"),
-                    status=c["status"],
-                    pipeline=c.get("pipeline"),
-                    pipelines=pipelines_list if pipelines_list else None,
-                )
-            )
-
-        # Debug: Log what GenerationChange objects have
-        for change in changes:
-            logger.info(f"  GenerationChange object: {change.change_id}, pipeline={change.pipeline}, pipelines={len(change.pipelines)} linked")
+        generations = cls._load_joined(data, _WHERE_GENERATION_ID, (generation_id,))
+        return generations[0] if generations else None
 
+    @classmethod
+    def _from_row(cls, row: sqlite3.Row, changes: List[GenerationChange]) -> Generation:
+        """Build a Generation from a `generations` row and its loaded changes"""
         # Parse datetime strings from DB
-        created_at = row.get("created_at")
+        created_at = row["created_at"]
         if created_at and isinstance(created_at, str):
             try:
                 created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
             except (ValueError, AttributeError):
                 created_at = None
 
-        promoted_at = row.get("promoted_at")
+        promoted_at = row["promoted_at"]
         if promoted_at and isinstance(promoted_at, str):
             try:
                 promoted_at = datetime.fromisoformat(promoted_at.replace('Z', '+00:00'))
@@ -204,29 +316,22 @@ class Generation:
         return cls(
             generation_id=row["generation_id"],
             version=row["version"],
-            description=row.get("description"),
+            description=row["description"],
             changes=changes,
-            pipeline_template=row.get("pipeline_template"),
+            pipeline_template=row["pipeline_template"],
             status=row["status"],
-            sync_status=row.get("sync_status", "not_synced"),
-            remote_id=row.get("remote_id"),
+            sync_status=row["sync_status"],
+            remote_id=row["remote_id"],
             created_at=created_at,
             promoted_at=promoted_at,
-            created_by=row.get("created_by"),
-            promoted_by=row.get("promoted_by"),
-            team_id=row.get("team_id"),
+            created_by=row["created_by"],
+            promoted_by=row["promoted_by"],
+            team_id=row["team_id"],
+            is_hotfix=bool(row["is_hotfix"]),
         )
 
     def save_to_db(self, data: SqliteData, emit_event: bool = True) -> None:
         """Save this Generation to the database"""
-        # Check if exists
-        existing = data.query(
-            "SELECT generation_id FROM generations WHERE generation_id = ?",
-            (self.generation_id,),
-        )
-
-        is_new = not existing
-
         gen_dict = {
             "generation_id": self.generation_id,
             "version": self.version,
@@ -239,44 +344,50 @@ class Generation:
             "created_by": self.created_by,
             "promoted_by": self.promoted_by,
             "team_id": self.team_id,
+            "is_hotfix": int(self.is_hotfix),
         }
 
-        if existing:
-            # Update
-            data.update(
-                "generations",
-                gen_dict,
-                "generation_id = ?",
-                (self.generation_id,),
-            )
-        else:
-            # Insert
-            gen_dict["created_at"] = self.created_at
-            data.insert("generations", gen_dict)
-
-        # Save changes
-        for change in self.changes:
-            change_dict = {
-                "change_id": change.change_id,
-                "generation_id": self.generation_id,
-                "type": change.type,
-                "title": change.title,
-                "description": change.description,
-                "status": change.status,
-                "pipeline": change.pipeline,
-            }
-            existing_change = data.query(
-                "SELECT change_id FROM generation_changes WHERE change_id = ?",
-                (change.change_id,),
+        with data.transaction():
+            # Check if exists
+            existing = data.query_one(_SQL_GENERATION_EXISTS, (self.generation_id,)) is not None
+
+            is_new = not existing
+
+            if existing:
+                # Update
+                data.update(
+                    "generations",
+                    gen_dict,
+                    "generation_id = ?",
+                    (self.generation_id,),
+                )
+            else:
+                # Insert
+                gen_dict["created_at"] = self.created_at
+                data.insert("generations", gen_dict)
+
+            # Save changes (existing change rows are left untouched)
+            data.executemany(
+                _SQL_INSERT_CHANGE,
+                [
+                    (
+                        change.change_id,
+                        self.generation_id,
+                        change.type,
+                        change.title,
+                        change.description,
+                        change.status,
+                        change.pipeline,
+                    )
+                    for change in self.changes
+                ],
             )
-            if not existing_change:
-                data.insert("generation_changes", change_dict)
 
         # Emit event
         if emit_event:
             bus = get_event_bus()
             event_name = "generation.created" if is_new else "generation.updated"
-            bus.emit(event_name, {"generation": self.to_dict()})
+            bus.emit_async(event_name, {"generation": self.to_dict()})
 
     def save_to_yaml(self, generations_dir: Path) -> Path:
         """Save this Generation to a YAML file"""
@@ -289,8 +400,11 @@ class Generation:
         if self.pipeline_template:
             yaml_data["pipeline_template"] = self.pipeline_template
 
-        with open(yaml_path, "w") as f:
-            yaml.dump(yaml_data, f, default_flow_style=False, sort_keys=False)
+        # Serialize in memory and write once
+        yaml, _, dumper = _yaml_safe_io()
+        yaml_path.write_bytes(
+            yaml.dump(yaml_data, Dumper=dumper, default_flow_style=False, sort_keys=False, encoding="utf-8")
+        )
 
         return yaml_path
 
@@ -305,14 +419,17 @@ class Generation:
             "status": self.status,
             "sync_status": self.sync_status,
             "remote_id": self.remote_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "promoted_at": self.promoted_at.isoformat() if self.promoted_at else None,
+            "created_at": self._created_at_iso,
+            "promoted_at": self._promoted_at_iso,
             "team_id": self.team_id,
         }
 
     @staticmethod
     def _validate_schema(data: Dict[str, Any]) -> None:
         """Validate Generation YAML against JSON schema"""
+        if _is_valid_generation(data):
+            return
+
         try:
             import jsonschema
         except ImportError:
@@ -323,16 +440,76 @@ class Generation:
         if not schema_path.exists():
             return
 
-        with open(schema_path, "r") as f:
-            schema = json.load(f)
+        schema = _json_loads(schema_path.read_bytes())
 
         jsonschema.validate(data, schema)
 
     @staticmethod
     def list_all(data: SqliteData) -> List[Generation]:
         """List all generations from database"""
-        rows = data.query("SELECT generation_id FROM generations ORDER BY created_at DESC")
-        return [Generation.from_db(data, row["generation_id"]) for row in rows if Generation.from_db(data, row["generation_id"])]
+        return Generation._load_joined(data)
+
+    @staticmethod
+    def list_hotfixes(data: SqliteData) -> List[Generation]:
+        """List hot-fix generations (newest first) with their changes"""
+        return Generation._load_joined(data, _WHERE_HOTFIX)
+
+    @staticmethod
+    def list_summaries(data: SqliteData) -> List[sqlite3.Row]:
+        """List generation summary rows (with change_count) without loading changes.
+
+        Rows come straight from one aggregate query; columns are read by name.
+        """
+        return data.query_rows(_SQL_GENERATION_SUMMARIES)
+
+    @classmethod
+    def from_db_by_version(cls, data: SqliteData, version: str) -> Optional[Generation]:
+        """Load a Generation (with its changes) by version string"""
+        version = version if version.startswith("v") else f"v{version}"
+        generations = cls._load_joined(data, _WHERE_VERSION, (version,))
+        return generations[0] if generations else None
+
+    @classmethod
+    def _load_joined(cls, data: SqliteData, where: str = "", params: tuple = ()) -> List[Generation]:
+        """Load generations matching `where` (on alias g) with their changes and pipelines.
+
+        Issues one JOIN for generations + changes and one query for linked
+        pipelines, regardless of how many generations match.
+        """
+        rows = data.query_rows(_SQL_GENERATIONS_WITH_CHANGES.format(where=where), params)
+        if not rows:
+            return []
+
+        pipelines_by_change: Dict[tuple, List[Dict[str, Any]]] = {}
+        for change_id, generation_id, pipeline_name, is_primary, created_by in data.query_rows(
+            _SQL_CHANGE_PIPELINES.format(where=where), params
+        ):
+            pipelines_by_change.setdefault((change_id, generation_id), []).append(
+                {
+                    "pipeline_name": pipeline_name,
+                    "is_primary": bool(is_primary),
+                    "created_by": created_by,
+                }
+            )
+
+        generations = []
+        for _, group in groupby(rows, key=lambda r: r["generation_id"]):
+            group_rows = list(group)
+            changes = [
+                GenerationChange(
+                    change_id=r["c_change_id"],
+                    change_type=r["c_type"],
+                    title=r["c_title"],
+                    description=r["c_description"],
+                    status=r["c_status"],
+                    pipeline=r["c_pipeline"],
+                    pipelines=pipelines_by_change.get((r["c_change_id"], r["generation_id"])),
+                )
+                for r in group_rows
+                if r["c_change_id"] is not None
+            ]
+            generations.append(cls._from_row(group_rows[0], changes))
+        return generations
 
     def promote(
         self,
@@ -406,7 +583,7 @@ class Generation:
 
         # Emit promotion event
         bus = get_event_bus()
-        bus.emit("generation.promoted", {"generation": self.to_dict()})
+        bus.emit_async("generation.promoted", {"generation": self.to_dict()})
 
         return {
             "success": True,
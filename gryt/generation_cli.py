@@ -3,15 +3,17 @@ CLI commands for Generation contract management (v0.2.0)
 """
 from __future__ import annotations
 
-import json
-import sys
-import uuid
+import concurrent.futures
+import os
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from secrets import token_hex
 from typing import Optional
 
 import typer
-import yaml
 
+from .config import Config
 from .generation import Generation, GenerationChange
 from .data import SqliteData
 from .pipeline_templates import generate_pipeline_template, sanitize_change_id
@@ -21,6 +23,13 @@ GRYT_DIRNAME = ".gryt"
 GENERATIONS_SUBDIR = "generations"
 DEFAULT_DB_RELATIVE = "gryt.db"
 
+# Pipeline links written by gen-test; a fixed statement so sqlite3 reuses the prepared form
+_SQL_LINK_CHANGE_PIPELINE = (
+    "INSERT OR IGNORE INTO change_pipelines "
+    "(change_id, generation_id, pipeline_name, is_primary, created_at, created_by) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
 generation_app = typer.Typer(
     name="generation",
     help="Manage generation contracts (release definitions)",
@@ -28,39 +37,87 @@ generation_app = typer.Typer(
 )
 
 
+# One connection is shared by every _get_db() call made while a generation
+# subcommand runs, so pragma/setup cost and sqlite3's statement cache are paid
+# once per invocation. It is closed when the Typer context tears down.
+_shared_db: Optional[SqliteData] = None
+_share_db = False
+
+
+@generation_app.callback()
+def _generation_callback(ctx: typer.Context) -> None:
+    global _share_db
+    _share_db = True
+    _repo_gryt_dir_for.cache_clear()
+    ctx.call_on_close(_close_shared_db)
+
+
+def _close_shared_db() -> None:
+    global _shared_db, _share_db
+    if _shared_db is not None:
+        _shared_db.close()
+        _shared_db = None
+    _share_db = False
+
+
+def _release_db(data: SqliteData) -> None:
+    """Close a connection from _get_db() unless it is the shared one"""
+    if data is not _shared_db:
+        data.close()
+
+
+@lru_cache(maxsize=1)
+def _repo_gryt_dir_for(cwd: str) -> Path:
+    from .paths import ensure_in_repo
+
+    return ensure_in_repo() / GRYT_DIRNAME
+
+
+def _repo_gryt_dir() -> Path:
+    """Return the repo's .gryt directory, raising RuntimeError outside a gryt repo.
+
+    The repo-root walk is cached per working directory (and reset for each
+    generation subcommand), so helpers can call this freely.
+    """
+    return _repo_gryt_dir_for(os.getcwd())
+
+
 def _get_db() -> SqliteData:
     """Get database connection from .gryt directory"""
-    from .paths import get_repo_db_path, ensure_in_repo
-
-    # Ensure we're in a repo
-    ensure_in_repo()
+    global _shared_db
+    if _shared_db is not None:
+        return _shared_db
 
-    db_path = get_repo_db_path()
-    if not db_path or not db_path.exists():
+    db_path = _repo_gryt_dir() / DEFAULT_DB_RELATIVE
+    if not db_path.exists():
         typer.echo(
             f"Error: Database not found at {db_path}. Run 'gryt init' first.",
             err=True,
         )
         raise typer.Exit(2)
-    return SqliteData(db_path=str(db_path))
+    data = SqliteData(db_path=str(db_path))
+    data.apply_performance_pragmas()
+    if _share_db:
+        _shared_db = data
+    return data
 
 
-def _get_generations_dir() -> Path:
-    """Get or create .gryt/generations directory"""
-    from .paths import get_repo_gryt_dir, ensure_in_repo
+def _fit(text: str, width: int) -> str:
+    """Left-align text in a column of width chars, ending in '...' if it had to be cut"""
+    if len(text) > width:
+        return f"{text:.{width - 3}}..."
+    return f"{text:<{width}}"
 
-    # Ensure we're in a repo
-    ensure_in_repo()
 
-    repo_gryt_dir = get_repo_gryt_dir()
-    if not repo_gryt_dir:
-        typer.echo(
-            f"Error: Not in a gryt repository. Run 'gryt init' first.",
-            err=True,
-        )
-        raise typer.Exit(2)
+def _generation_id_for_version(data: SqliteData, version: str) -> Optional[str]:
+    """Return the generation_id for a version, or None if it doesn't exist"""
+    row = data.query_one("SELECT generation_id FROM generations WHERE version = ? LIMIT 1", (version,))
+    return row[0] if row else None
+
 
-    gen_dir = repo_gryt_dir / GENERATIONS_SUBDIR
+def _get_generations_dir() -> Path:
+    """Get or create .gryt/generations directory"""
+    gen_dir = _repo_gryt_dir() / GENERATIONS_SUBDIR
     gen_dir.mkdir(parents=True, exist_ok=True)
     return gen_dir
 
@@ -80,21 +137,19 @@ def cmd_generation_new(
         data = _get_db()
 
         # Check if version already exists
-        existing = data.query("SELECT version FROM generations WHERE version = ?", (version,))
-        if existing:
+        if _generation_id_for_version(data, version):
             typer.echo(f"Error: Generation {version} already exists", err=True)
-            data.close()
+            _release_db(data)
             return 2
 
         # Get current user from config
-        from .config import Config
         config = Config.load_with_repo_context()
         current_user = config.username or "local"
 
         # Create generation with placeholder change
         changes = [
             GenerationChange(
-                change_id=f"CHANGE-{str(uuid.uuid4())[:8].upper()}",
+                change_id=f"CHANGE-{token_hex(4).upper()}",
                 change_type="add",
                 title="Placeholder change - edit YAML to customize",
             )
@@ -115,13 +170,14 @@ def cmd_generation_new(
         # Save to YAML file
         gen_dir = _get_generations_dir()
         yaml_path = generation.save_to_yaml(gen_dir)
+        rel_yaml_path = yaml_path.relative_to(Path.cwd())
 
-        data.close()
+        _release_db(data)
 
         typer.echo(f"✓ Created generation {version}")
         typer.echo(f"  Database: .gryt/gryt.db")
-        typer.echo(f"  YAML: {yaml_path.relative_to(Path.cwd())}")
-        typer.echo(f"\nEdit {yaml_path.relative_to(Path.cwd())} to define changes.")
+        typer.echo(f"  YAML: {rel_yaml_path}")
+        typer.echo(f"\nEdit {rel_yaml_path} to define changes.")
         typer.echo(f"Then run 'gryt generation update {version}' to sync changes to database.")
         return 0
 
@@ -140,24 +196,30 @@ def cmd_generation_update(version: str) -> int:
         data = _get_db()
 
         # Check if version exists
-        existing = data.query("SELECT generation_id FROM generations WHERE version = ?", (version,))
-        if not existing:
+        generation_id = _generation_id_for_version(data, version)
+        if not generation_id:
             typer.echo(f"Error: Generation {version} not found in database", err=True)
             typer.echo(f"Create it first with 'gryt generation new {version}'")
-            data.close()
+            _release_db(data)
             return 2
 
-        generation_id = existing[0]["generation_id"]
-
         # Find YAML file
         gen_dir = _get_generations_dir()
         yaml_path = gen_dir / f"{version}.yaml"
 
         if not yaml_path.exists():
             typer.echo(f"Error: YAML file not found at {yaml_path}", err=True)
-            data.close()
+            _release_db(data)
             return 2
 
+        # Nothing to do if the YAML hasn't been touched since the last update
+        yaml_mtime = yaml_path.stat().st_mtime_ns
+        synced = data.query_one("SELECT yaml_mtime FROM generations WHERE generation_id = ?", (generation_id,))
+        if synced is not None and synced[0] == yaml_mtime:
+            _release_db(data)
+            typer.echo(f"Generation {version} is already in sync with {yaml_path.relative_to(Path.cwd())}")
+            return 0
+
         # Load generation from YAML
         typer.echo(f"Reading changes from {yaml_path.relative_to(Path.cwd())}...")
         updated_gen = Generation.from_yaml_file(yaml_path)
@@ -165,96 +227,88 @@ def cmd_generation_update(version: str) -> int:
         # Preserve the original generation_id
         updated_gen.generation_id = generation_id
 
-        # Update database
-        # Get existing changes to preserve pipeline data
-        existing_changes = data.query(
-            "SELECT change_id, pipeline FROM generation_changes WHERE generation_id = ?",
-            (generation_id,)
-        )
-        existing_pipelines = {row["change_id"]: row["pipeline"] for row in existing_changes}
-
-        # Get list of change IDs from YAML
-        yaml_change_ids = {change.change_id for change in updated_gen.changes}
-        existing_change_ids = set(existing_pipelines.keys())
-
-        # Check for changes removed from YAML that have evolutions
-        removed_change_ids = existing_change_ids - yaml_change_ids
-        if removed_change_ids:
-            # Check which removed changes have evolutions
-            changes_to_delete = []
-            changes_to_preserve = []
-
-            for change_id in removed_change_ids:
-                evolutions = data.query(
-                    "SELECT COUNT(*) as count FROM evolutions WHERE change_id = ?",
-                    (change_id,)
+        # Update database in a single transaction
+        with data.transaction():
+            existing_change_ids = {
+                row["change_id"]
+                for row in data.query_rows(
+                    "SELECT change_id FROM generation_changes WHERE generation_id = ?",
+                    (generation_id,)
                 )
-                if evolutions and evolutions[0]["count"] > 0:
-                    changes_to_preserve.append((change_id, evolutions[0]["count"]))
-                else:
-                    changes_to_delete.append(change_id)
-
-            # Warn about preserved changes
-            if changes_to_preserve:
-                typer.echo("\nWarning: The following changes were removed from YAML but have evolutions:", err=True)
-                for change_id, count in changes_to_preserve:
-                    typer.echo(f"  • {change_id}: {count} evolution(s) - PRESERVING in database", err=True)
-
-            # Delete changes that have NO evolutions
-            for change_id in changes_to_delete:
-                typer.echo(f"  Deleting change {change_id} (no evolutions)")
-                data.conn.execute(
+            }
+
+            # Get list of change IDs from YAML
+            yaml_change_ids = {change.change_id for change in updated_gen.changes}
+
+            # Check for changes removed from YAML that have evolutions
+            removed_change_ids = existing_change_ids - yaml_change_ids
+            if removed_change_ids:
+                # Count evolutions for all removed changes at once
+                placeholders = ", ".join("?" * len(removed_change_ids))
+                evolution_counts = dict(
+                    data.query_rows(
+                        f"SELECT change_id, COUNT(*) FROM evolutions WHERE change_id IN ({placeholders}) GROUP BY change_id",
+                        tuple(removed_change_ids)
+                    )
+                )
+                changes_to_preserve = [
+                    (change_id, evolution_counts[change_id])
+                    for change_id in removed_change_ids
+                    if change_id in evolution_counts
+                ]
+                changes_to_delete = [
+                    change_id for change_id in removed_change_ids if change_id not in evolution_counts
+                ]
+
+                # Warn about preserved changes
+                if changes_to_preserve:
+                    typer.echo("\nWarning: The following changes were removed from YAML but have evolutions:", err=True)
+                    for change_id, count in changes_to_preserve:
+                        typer.echo(f"  • {change_id}: {count} evolution(s) - PRESERVING in database", err=True)
+
+                # Delete changes that have NO evolutions
+                for change_id in changes_to_delete:
+                    typer.echo(f"  Deleting change {change_id} (no evolutions)")
+                data.executemany(
                     "DELETE FROM generation_changes WHERE generation_id = ? AND change_id = ?",
-                    (generation_id, change_id)
+                    [(generation_id, change_id) for change_id in changes_to_delete]
                 )
 
-        # Update generation record and mark as modified (needs sync)
-        data.update(
-            "generations",
-            {
-                "description": updated_gen.description,
-                "pipeline_template": updated_gen.pipeline_template,
-                "sync_status": "not_synced",  # Mark as needing sync
-            },
-            "generation_id = ?",
-            (generation_id,)
-        )
+            # Update generation record and mark as modified (needs sync)
+            data.update(
+                "generations",
+                {
+                    "description": updated_gen.description,
+                    "pipeline_template": updated_gen.pipeline_template,
+                    "sync_status": "not_synced",  # Mark as needing sync
+                    "yaml_mtime": yaml_mtime,
+                },
+                "generation_id = ?",
+                (generation_id,)
+            )
 
-        # Update or insert changes
-        for change in updated_gen.changes:
-            if change.change_id in existing_change_ids:
-                # Update existing change, preserving pipeline field
-                data.update(
-                    "generation_changes",
-                    {
-                        "type": change.type,
-                        "title": change.title,
-                        "description": change.description,
-                        "status": change.status,
-                        # Preserve existing pipeline value from database
-                        "pipeline": existing_pipelines[change.change_id],
-                    },
-                    "generation_id = ? AND change_id = ?",
-                    (generation_id, change.change_id)
-                )
-            else:
-                # Insert new change
-                data.insert(
-                    "generation_changes",
-                    {
-                        "generation_id": generation_id,
-                        "change_id": change.change_id,
-                        "type": change.type,
-                        "title": change.title,
-                        "description": change.description,
-                        "status": change.status,
-                        "pipeline": change.pipeline,
-                    }
-                )
+            # Update existing changes (their pipeline field is left as-is)
+            data.executemany(
+                "UPDATE generation_changes SET type = ?, title = ?, description = ?, status = ? WHERE generation_id = ? AND change_id = ?",
+                [
+                    (change.type, change.title, change.description, change.status, generation_id, change.change_id)
+                    for change in updated_gen.changes
+                    if change.change_id in existing_change_ids
+                ]
+            )
 
-        data.conn.commit()
+            # Insert new changes
+            data.insert_many(
+                "generation_changes",
+                ("generation_id", "change_id", "type", "title", "description", "status", "pipeline"),
+                [
+                    (generation_id, change.change_id, change.type, change.title, change.description, change.status, change.pipeline)
+                    for change in updated_gen.changes
+                    if change.change_id not in existing_change_ids
+                ]
+            )
 
-        data.close()
+        _release_db(data)
 
         typer.echo(f"✓ Updated generation {version} from YAML")
         typer.echo(f"  Changes: {len(updated_gen.changes)}")
@@ -272,24 +326,26 @@ def cmd_generation_list() -> int:
     """List all generations"""
     try:
         data = _get_db()
-        generations = Generation.list_all(data)
-        data.close()
+        generations = Generation.list_summaries(data)
+        _release_db(data)
 
         if not generations:
             typer.echo("No generations found. Create one with 'gryt generation new <version>'")
             return 0
 
-        typer.echo("Generations:\n")
-        typer.echo(f"{'Version':<15} {'Status':<12} {'Changes':<10} {'Sync':<15} {'Team':<20} {'Description':<30}")
-        typer.echo("-" * 110)
-
+        # Build the table and write it once rather than echoing per line
+        lines = [
+            "Generations:\n",
+            f"{'Version':<15} {'Status':<12} {'Changes':<10} {'Sync':<15} {'Team':<20} {'Description':<30}",
+            "-" * 110,
+        ]
         for gen in generations:
-            changes_count = len(gen.changes)
-            desc = (gen.description or "")[:27] + "..." if gen.description and len(gen.description) > 30 else (gen.description or "")
-            team_display = (gen.team_id[:17] + "...") if gen.team_id and len(gen.team_id) > 20 else (gen.team_id or "-")
-            typer.echo(
-                f"{gen.version:<15} {gen.status:<12} {changes_count:<10} {gen.sync_status:<15} {team_display:<20} {desc:<30}"
+            team = _fit(gen["team_id"] or "-", 20)
+            desc = _fit(gen["description"] or "", 30)
+            lines.append(
+                f"{gen['version']:<15} {gen['status']:<12} {gen['change_count']:<10} {gen['sync_status']:<15} {team} {desc}"
             )
+        typer.echo("\n".join(lines))
 
         return 0
 
@@ -306,39 +362,34 @@ def cmd_generation_show(version: str) -> int:
 
         data = _get_db()
 
-        # Find generation by version
-        rows = data.query("SELECT generation_id FROM generations WHERE version = ?", (version,))
-        if not rows:
-            typer.echo(f"Error: Generation {version} not found", err=True)
-            data.close()
-            return 2
-
-        generation = Generation.from_db(data, rows[0]["generation_id"])
-        data.close()
+        # Find generation (and its changes) by version
+        generation = Generation.from_db_by_version(data, version)
+        _release_db(data)
 
         if not generation:
             typer.echo(f"Error: Generation {version} not found", err=True)
             return 2
 
-        # Display generation details
-        typer.echo(f"\nGeneration: {generation.version}")
-        typer.echo(f"Status: {generation.status}")
-        typer.echo(f"Description: {generation.description or '(none)'}")
-        typer.echo(f"Pipeline Template: {generation.pipeline_template or '(none)'}")
-        typer.echo(f"Sync Status: {generation.sync_status}")
+        # Display generation details, written once rather than echoing per line
+        lines = [
+            f"\nGeneration: {generation.version}",
+            f"Status: {generation.status}",
+            f"Description: {generation.description or '(none)'}",
+            f"Pipeline Template: {generation.pipeline_template or '(none)'}",
+            f"Sync Status: {generation.sync_status}",
+        ]
         if generation.remote_id:
-            typer.echo(f"Remote ID: {generation.remote_id}")
-        typer.echo(f"Created: {generation.created_at}")
+            lines.append(f"Remote ID: {generation.remote_id}")
+        lines.append(f"Created: {generation.created_at}")
         if generation.promoted_at:
-            typer.echo(f"Promoted: {generation.promoted_at}")
-
-        typer.echo(f"\nChanges ({len(generation.changes)}):")
-        typer.echo(f"{'ID':<20} {'Type':<10} {'Status':<12} {'Title':<50}")
-        typer.echo("-" * 100)
+            lines.append(f"Promoted: {generation.promoted_at}")
 
+        lines.append(f"\nChanges ({len(generation.changes)}):")
+        lines.append(f"{'ID':<20} {'Type':<10} {'Status':<12} {'Title':<50}")
+        lines.append("-" * 100)
         for change in generation.changes:
-            title = change.title[:47] + "..." if len(change.title) > 50 else change.title
-            typer.echo(f"{change.change_id:<20} {change.type:<10} {change.status:<12} {title:<50}")
+            lines.append(f"{change.change_id:<20} {change.type:<10} {change.status:<12} {_fit(change.title, 50)}")
+        typer.echo("\n".join(lines))
 
         return 0
 
@@ -369,29 +420,15 @@ def cmd_generation_gen_test(
 
         data = _get_db()
 
-        # Find generation by version
-        rows = data.query("SELECT generation_id FROM generations WHERE version = ?", (version,))
-        if not rows:
-            typer.echo(f"Error: Generation {version} not found", err=True)
-            data.close()
-            return 2
-
-        generation = Generation.from_db(data, rows[0]["generation_id"])
+        # Find generation (and its changes) by version
+        generation = Generation.from_db_by_version(data, version)
         if not generation:
             typer.echo(f"Error: Generation {version} not found", err=True)
-            data.close()
+            _release_db(data)
             return 2
 
         # Get pipelines directory
-        from .paths import get_repo_gryt_dir, ensure_in_repo
-        ensure_in_repo()
-        gryt_dir = get_repo_gryt_dir()
-        if not gryt_dir:
-            typer.echo("Error: Not in a gryt repository", err=True)
-            data.close()
-            return 2
-
-        pipelines_dir = gryt_dir / "pipelines"
+        pipelines_dir = _repo_gryt_dir() / "pipelines"
         pipelines_dir.mkdir(parents=True, exist_ok=True)
 
         # Determine which changes to process
@@ -403,13 +440,18 @@ def cmd_generation_gen_test(
             matching_changes = [c for c in generation.changes if c.change_id == change_id]
             if not matching_changes:
                 typer.echo(f"Error: Change {change_id} not found in generation {version}", err=True)
-                data.close()
+                _release_db(data)
                 return 2
             changes_to_process = matching_changes
 
-        # Generate pipeline files
+        # Generate pipeline files; DB writes are collected and applied together
         generated_files = []
+        pending_writes = []
+        pipeline_updates = []
+        pipeline_links = []
         sanitized_version = version.replace(".", "_").replace("-", "_")  # v2.2.0 -> v2_2_0
+        current_user = Config.load_with_repo_context().username or "local"
+        linked_at = datetime.utcnow().isoformat()
 
         for change in changes_to_process:
             # Check if pipeline already exists
@@ -431,50 +473,50 @@ def cmd_generation_gen_test(
                 change.description,
             )
 
-            # Write pipeline file
-            with open(pipeline_path, "w") as f:
-                f.write(pipeline_content)
+            pending_writes.append((pipeline_path, pipeline_content))
 
             # Update change in database with pipeline link
-            data.update(
-                "generation_changes",
-                {"pipeline": pipeline_filename},
-                "change_id = ?",
-                (change.change_id,),
-            )
+            pipeline_updates.append((pipeline_filename, change.change_id))
 
             # Link pipeline in change_pipelines table (v1.0.10)
-            from .config import Config
-            from datetime import datetime
-            config = Config.load_with_repo_context()
-            current_user = config.username or "local"
-
-            # Check if this pipeline is already linked
-            existing_link = data.query(
-                "SELECT id FROM change_pipelines WHERE change_id = ? AND generation_id = ? AND pipeline_name = ?",
-                (change.change_id, generation.generation_id, pipeline_filename),
-            )
-            if not existing_link:
-                data.insert(
-                    "change_pipelines",
-                    {
-                        "change_id": change.change_id,
-                        "generation_id": generation.generation_id,
-                        "pipeline_name": pipeline_filename,
-                        "is_primary": 1,  # Generated pipelines are primary
-                        "created_at": datetime.utcnow().isoformat(),
-                        "created_by": current_user,
-                    },
+            # Existing links were loaded with the generation
+            if not any(p["pipeline_name"] == pipeline_filename for p in change.pipelines):
+                pipeline_links.append(
+                    (
+                        change.change_id,
+                        generation.generation_id,
+                        pipeline_filename,
+                        1,  # Generated pipelines are primary
+                        linked_at,
+                        current_user,
+                    )
                 )
 
             # Update in-memory change object
             change.pipeline = pipeline_filename
 
-            generated_files.append((change.change_id, pipeline_filename))
             action = "Regenerated" if is_regenerating else "Generated"
-            typer.echo(f"✓ {action} {pipeline_filename} for {change.change_id}")
+            generated_files.append((change.change_id, pipeline_filename, action))
 
-        data.close()
+        # Write pipeline files; they are independent, so overlap the I/O
+        if len(pending_writes) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(pending_writes))) as ex:
+                list(ex.map(lambda w: w[0].write_text(w[1], encoding="utf-8"), pending_writes))
+        else:
+            for path, content in pending_writes:
+                path.write_text(content, encoding="utf-8")
+
+        for generated_id, pipeline_filename, action in generated_files:
+            typer.echo(f"✓ {action} {pipeline_filename} for {generated_id}")
+
+        with data.transaction():
+            data.executemany(
+                "UPDATE generation_changes SET pipeline = ? WHERE change_id = ?",
+                pipeline_updates,
+            )
+            data.executemany(_SQL_LINK_CHANGE_PIPELINE, pipeline_links)
+
+        _release_db(data)
 
         if not generated_files:
             typer.echo("No new pipeline files generated")
@@ -504,23 +546,17 @@ def cmd_generation_promote(version: str, no_tag: bool = False) -> int:
 
         data = _get_db()
 
-        # Find generation by version
-        rows = data.query("SELECT generation_id FROM generations WHERE version = ?", (version,))
-        if not rows:
-            typer.echo(f"Error: Generation {version} not found", err=True)
-            data.close()
-            return 2
-
-        generation = Generation.from_db(data, rows[0]["generation_id"])
+        # Find generation (and its changes) by version
+        generation = Generation.from_db_by_version(data, version)
         if not generation:
             typer.echo(f"Error: Generation {version} not found", err=True)
-            data.close()
+            _release_db(data)
             return 2
 
         # Check if already promoted
         if generation.status == "promoted":
             typer.echo(f"Error: Generation {version} is already promoted", err=True)
-            data.close()
+            _release_db(data)
             return 2
 
         typer.echo(f"Promoting generation {version}...")
@@ -529,7 +565,7 @@ def cmd_generation_promote(version: str, no_tag: bool = False) -> int:
         # Run promotion
         result = generation.promote(data, auto_tag=not no_tag, repo_path=Path.cwd())
 
-        data.close()
+        _release_db(data)
 
         # Display gate results
         for gate_result in result["gate_results"]:
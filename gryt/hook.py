@@ -1,11 +1,32 @@
 from __future__ import annotations
 
+import atexit
+import http.client
 import json
+import queue
+import reprlib
 import sys
+import threading
+import time
 import traceback
-import urllib.request
+import urllib.parse
 from abc import ABC
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:  # optional faster JSON encoder, returns bytes directly
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Bounded repr for log lines: cost stays independent of the size of the object
+_short_repr = reprlib.Repr()
+_short_repr.maxlevel = 4
+_short_repr.maxdict = 20
+_short_repr.maxstring = 80
 
 
 class Hook(ABC):
@@ -65,7 +86,10 @@ class PrintHook(Hook):
 
     def on_pipeline_end(self, pipeline: Any, results: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> None:
         try:
-            print(f"[hook] pipeline_end: results={json.dumps(results)[:500]}", file=self.stream)
+            summary = _short_repr.repr(results)
+            if len(summary) > 500:
+                summary = summary[:497] + "..."
+            print(f"[hook] pipeline_end: results={summary}", file=self.stream)
         except Exception:
             pass
 
@@ -84,13 +108,17 @@ class PrintHook(Hook):
 
     def on_error(self, scope: str, error: Exception, context: Optional[Dict[str, Any]] = None) -> None:
         try:
-            print(f"[hook] error in {scope}: {error}\n{traceback.format_exc()}", file=sys.stderr)
+            # Format the error's own traceback (bounded) rather than whatever sys.exc_info() holds
+            details = traceback.format_exception_only(type(error), error)
+            if error.__traceback__ is not None:
+                details = ["Traceback (most recent call last):\n", *traceback.format_tb(error.__traceback__, limit=10), *details]
+            print(f"[hook] error in {scope}: {error}\n{''.join(details)}", file=sys.stderr)
         except Exception:
             pass
 
 
 class HttpHook(Hook):
-    """HTTP hook using urllib (no external deps).
+    """HTTP hook using http.client (no external deps).
 
     Config:
     - base_url: str – base URL for events.
@@ -100,21 +128,51 @@ class HttpHook(Hook):
       (pipeline_start, pipeline_end, step_start, step_end, error).
 
     Body is JSON: {"event": <name>, "payload": {...}}.
+
+    Events are queued and posted from a background thread so hook latency
+    stays off the pipeline's critical path; if the queue is full the event
+    is dropped. One keep-alive connection per host is reused across events.
+    on_pipeline_end and a pipeline-scope on_error drain the queue (bounded by
+    timeout) and close it; events still pending are drained at interpreter
+    exit so early returns do not lose them.
+
+    Transient failures (connection errors, 502/503/504) are retried with
+    exponential backoff. After several consecutive undeliverable events the
+    hook disables itself until the next pipeline starts.
     """
 
+    _MAX_PENDING = 1000
+    _STOP = object()
+    _RETRIES = 2
+    _BACKOFF = 0.1
+    _RETRY_STATUSES = frozenset({502, 503, 504})
+    _MAX_CONSECUTIVE_FAILURES = 5
+
     def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = 10.0, paths: Optional[Dict[str, str]] = None) -> None:
         self.base_url = base_url.rstrip("/")
         self.headers = headers or {"Content-Type": "application/json"}
         self.timeout = timeout or 10.0
         self.paths = paths or {}
+        self._connections: Dict[Tuple[str, str], http.client.HTTPConnection] = {}
+        self._conn_lock = threading.Lock()
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self._MAX_PENDING)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._atexit_registered = False
+        self._consecutive_failures = 0
+        self._disabled = False
 
     # Event callbacks
     def on_pipeline_start(self, pipeline: Any, context: Optional[Dict[str, Any]] = None) -> None:
+        self._consecutive_failures = 0
+        self._disabled = False
         payload = {"runners": len(getattr(pipeline, "runners", []))}
         self._post("pipeline_start", payload)
 
     def on_pipeline_end(self, pipeline: Any, results: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> None:
         self._post("pipeline_end", {"results": results})
+        self._stop_worker()
+        self.close()
 
     def on_step_start(self, step: Any, context: Optional[Dict[str, Any]] = None) -> None:
         self._post("step_start", {"id": getattr(step, "id", None)})
@@ -124,22 +182,106 @@ class HttpHook(Hook):
 
     def on_error(self, scope: str, error: Exception, context: Optional[Dict[str, Any]] = None) -> None:
         self._post("error", {"scope": scope, "error": str(error)})
+        if scope == "pipeline":
+            # The pipeline is about to raise without reaching on_pipeline_end
+            self._stop_worker()
+            self.close()
+
+    def close(self) -> None:
+        """Close any pooled connections (they reopen on the next event)."""
+        with self._conn_lock:
+            for conn in self._connections.values():
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._connections.clear()
 
     # Internal
     def _post(self, event: str, payload: Dict[str, Any]) -> None:
+        if self._disabled:
+            return None
         try:
-            import urllib.parse
-
             path = self.paths.get(event, f"/{event}")
-            url = self.base_url + path
-            body = json.dumps({"event": event, "payload": payload}).encode("utf-8")
-            req = urllib.request.Request(url=url, data=body, headers=self.headers, method="POST")
-            with urllib.request.urlopen(req, timeout=self.timeout) as _:
-                pass
+            url = urllib.parse.urlsplit(self.base_url + path)
+            target = url.path or "/"
+            if url.query:
+                target += "?" + url.query
+            body = _json_dumps({"event": event, "payload": payload})
+            self._ensure_worker()
+            self._queue.put_nowait((url.scheme, url.netloc, target, body))
         except Exception:
-            # Swallow errors to keep pipeline resilient
+            # Swallow errors (including a full queue) to keep pipeline resilient
             return None
 
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run_worker, name="gryt-http-hook", daemon=True)
+                self._worker.start()
+                if not self._atexit_registered:
+                    atexit.register(self._stop_worker)
+                    self._atexit_registered = True
+
+    def _stop_worker(self) -> None:
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        try:
+            self._queue.put(self._STOP, timeout=self.timeout)
+        except queue.Full:
+            return
+        worker.join(self.timeout)
+
+    def _run_worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            if self._disabled:
+                continue
+            try:
+                self._deliver(*item)
+            except Exception:
+                pass
+
+    def _deliver(self, scheme: str, netloc: str, target: str, body: bytes) -> None:
+        for attempt in range(self._RETRIES + 1):
+            if attempt:
+                time.sleep(self._BACKOFF * 2 ** (attempt - 1))
+            try:
+                with self._conn_lock:
+                    status = self._send(scheme, netloc, target, body)
+            except (http.client.HTTPException, OSError):
+                continue
+            if status not in self._RETRY_STATUSES:
+                self._consecutive_failures = 0
+                return
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self._MAX_CONSECUTIVE_FAILURES:
+            self._disabled = True
+
+    def _send(self, scheme: str, netloc: str, target: str, body: bytes) -> int:
+        key = (scheme, netloc)
+        conn = self._connections.get(key)
+        reused = conn is not None
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = self._connections[key] = conn_cls(netloc, timeout=self.timeout)
+        try:
+            conn.request("POST", target, body=body, headers=self.headers)
+            response = conn.getresponse()
+            response.read()  # drain so the connection can be reused
+            return response.status
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            del self._connections[key]
+            if not reused:
+                raise
+            # The server may have dropped the idle keep-alive connection; retry once fresh
+            return self._send(scheme, netloc, target, body)
+
 
 class PolicyHook(Hook):
     """
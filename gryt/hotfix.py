@@ -5,16 +5,53 @@ Provides fast-track workflow for emergency fixes with minimal gates.
 """
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
+from .audit import AuditTrail
 from .generation import Generation, GenerationChange
 from .evolution import Evolution
 from .data import SqliteData
 from .gates import PromotionGate, GateResult
 
 
+_SQL_EVOLUTION_STATUS_COUNTS = """
+    SELECT change_id,
+           SUM(status = 'pass') AS pass_ct,
+           SUM(status IN ('pending', 'running')) AS pending_ct
+    FROM evolutions
+    WHERE generation_id = ?
+    GROUP BY change_id
+"""
+
+@lru_cache(maxsize=1024)
+def _parse_semver(version: str) -> Tuple[int, int, int]:
+    """Parse "vX.Y.Z" (or "X.Y.Z") into integers, memoized per string"""
+    parts = version.lstrip("v").split(".")
+    if len(parts) != 3:
+        raise ValueError(f"Invalid version format: {version}")
+    try:
+        major, minor, patch = (int(p) for p in parts)
+    except ValueError:
+        raise ValueError(f"Invalid version format: {version}") from None
+    return major, minor, patch
+
+
+_SQL_MAX_PATCH = """
+    SELECT MAX(CAST(substr(version, length(?) + 1) AS INTEGER))
+    FROM generations
+    WHERE version LIKE ?
+"""
+
+_SQL_HOTFIX_COUNTS = """
+    SELECT COUNT(*), SUM(status = 'promoted'), SUM(status = 'draft')
+    FROM generations
+    WHERE is_hotfix = 1
+"""
+
+
 class HotfixGate(PromotionGate):
     """Minimal gate for hot-fix promotions
 
@@ -35,31 +72,31 @@ class HotfixGate(PromotionGate):
                 details={}
             )
 
+        # Per-change evolution counts for the whole generation in one query
+        counts = {
+            row["change_id"]: row
+            for row in data.query_rows(_SQL_EVOLUTION_STATUS_COUNTS, (generation.generation_id,))
+        }
+
         # Check each change has at least one passing evolution
         for change in generation.changes:
-            evolutions = data.query("""
-                SELECT status FROM evolutions
-                WHERE generation_id = ? AND change_id = ?
-            """, (generation.generation_id, change.change_id))
+            row = counts.get(change.change_id)
 
-            if not evolutions:
+            if row is None:
                 return GateResult(
                     passed=False,
                     message=f"Change {change.change_id} has no evolutions",
                     details={"change_id": change.change_id}
                 )
 
-            has_pass = any(e["status"] == "pass" for e in evolutions)
-            has_pending = any(e["status"] in ("pending", "running") for e in evolutions)
-
-            if not has_pass:
+            if not row["pass_ct"]:
                 return GateResult(
                     passed=False,
                     message=f"Change {change.change_id} has no passing evolution",
                     details={"change_id": change.change_id}
                 )
 
-            if has_pending:
+            if row["pending_ct"]:
                 return GateResult(
                     passed=False,
                     message=f"Change {change.change_id} has pending evolutions",
@@ -78,6 +115,7 @@ class HotfixWorkflow:
 
     def __init__(self, data: SqliteData):
         self.data = data
+        self._audit: Optional[AuditTrail] = None
 
     def create_hotfix_generation(
         self,
@@ -97,24 +135,27 @@ class HotfixWorkflow:
         Returns:
             Created Generation with hot-fix version
         """
-        # Calculate hot-fix version
-        hotfix_version = self._calculate_hotfix_version(base_version)
-
-        # Create generation with fix change
-        change = GenerationChange(
-            change_id=issue_id,
-            change_type="fix",
-            title=title,
-            description=description or f"Hot-fix for {base_version}"
-        )
+        # Pick the version and write the generation in one write transaction, so a
+        # concurrent hot-fix can't claim the same patch number in between
+        with self.data.transaction():
+            hotfix_version = self._calculate_hotfix_version(base_version)
+
+            # Create generation with fix change
+            change = GenerationChange(
+                change_id=issue_id,
+                change_type="fix",
+                title=title,
+                description=description or f"Hot-fix for {base_version}"
+            )
 
-        generation = Generation(
-            version=hotfix_version,
-            description=f"Hot-fix for {base_version}: {title}",
-            changes=[change]
-        )
+            generation = Generation(
+                version=hotfix_version,
+                description=f"Hot-fix for {base_version}: {title}",
+                changes=[change],
+                is_hotfix=True,
+            )
 
-        generation.save_to_db(self.data, emit_event=True)
+            generation.save_to_db(self.data, emit_event=True)
 
         return generation
 
@@ -125,31 +166,16 @@ class HotfixWorkflow:
         - v1.2.0 → v1.2.1
         - v1.2.3 → v1.2.4
         """
-        # Remove 'v' prefix if present
-        version = base_version.lstrip("v")
-
-        # Split into parts
-        parts = version.split(".")
-        if len(parts) != 3:
-            raise ValueError(f"Invalid version format: {base_version}")
-
-        major, minor, patch = parts
-
-        # Find highest existing patch version
-        existing = self.data.query("""
-            SELECT version FROM generations
-            WHERE version LIKE ?
-            ORDER BY version DESC
-            LIMIT 1
-        """, (f"v{major}.{minor}.%",))
-
-        if existing:
-            latest = existing[0]["version"].lstrip("v")
-            latest_parts = latest.split(".")
-            latest_patch = int(latest_parts[2])
-            new_patch = latest_patch + 1
+        major, minor, patch = _parse_semver(base_version)
+
+        # Find highest existing patch number (numerically, so 10 sorts after 9)
+        prefix = f"v{major}.{minor}."
+        row = self.data.query_one(_SQL_MAX_PATCH, (prefix, f"{prefix}%"))
+
+        if row is not None and row[0] is not None:
+            new_patch = row[0] + 1
         else:
-            new_patch = int(patch) + 1
+            new_patch = patch + 1
 
         return f"v{major}.{minor}.{new_patch}"
 
@@ -216,10 +242,11 @@ class HotfixWorkflow:
 
     def _log_hotfix_promotion(self, generation: Generation) -> None:
         """Log hot-fix promotion for audit purposes"""
-        from .audit import AuditTrail
-
-        audit = AuditTrail(self.data)
-        audit.log_event(
+        # Created once per workflow: AuditTrail() issues CREATE TABLE IF NOT EXISTS
+        if self._audit is None:
+            self._audit = AuditTrail(self.data)
+        # Off the promotion path; written in the background before the db closes
+        self._audit.log_event_async(
             event_type="hotfix.promoted",
             resource_type="generation",
             resource_id=generation.generation_id,
@@ -228,35 +255,27 @@ class HotfixWorkflow:
             details={
                 "version": generation.version,
                 "is_hotfix": True,
-                "promoted_at": datetime.now().isoformat()
+                # Epoch microseconds of the promotion; the event row has its own ISO timestamp
+                "promoted_at_us": (
+                    int(generation.promoted_at.timestamp() * 1_000_000)
+                    if generation.promoted_at
+                    else time.time_ns() // 1000
+                ),
             }
         )
 
     def list_hotfixes(self) -> List[Generation]:
         """List all hot-fix generations"""
-        rows = self.data.query("""
-            SELECT * FROM generations
-            WHERE version LIKE '%.%._%'
-            AND version NOT LIKE '%rc%'
-            ORDER BY created_at DESC
-        """)
-
-        generations = []
-        for row in rows:
-            gen = Generation.from_db(self.data, row["generation_id"])
-            if gen:
-                generations.append(gen)
-
-        return generations
+        return Generation.list_hotfixes(self.data)
 
     def get_hotfix_statistics(self) -> dict:
         """Get hot-fix statistics"""
-        hotfixes = self.list_hotfixes()
+        total, promoted, pending = self.data.query_one(_SQL_HOTFIX_COUNTS)
 
         stats = {
-            "total_hotfixes": len(hotfixes),
-            "promoted_hotfixes": sum(1 for g in hotfixes if g.status == "promoted"),
-            "pending_hotfixes": sum(1 for g in hotfixes if g.status == "draft"),
+            "total_hotfixes": total,
+            "promoted_hotfixes": promoted or 0,
+            "pending_hotfixes": pending or 0,
             "average_time_to_promote": None,  # TODO: Calculate
         }
 
@@ -283,6 +302,7 @@ def create_hotfix(
         Created Generation
     """
     data = SqliteData(db_path=str(db_path))
+    data.apply_performance_pragmas()
     try:
         workflow = HotfixWorkflow(data)
         return workflow.create_hotfix_generation(base_version, issue_id, title, description)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, TypeVar
+
+from ..step import CommandStep, Step
+
+# Step config keys handed through unchanged to the inner CommandStep
+_PASSTHROUGH = ("cwd", "env", "timeout")
+
+_T = TypeVar("_T")
+
+
+def frozen(step: Step, build: Callable[[Dict[str, Any]], _T]) -> _T:
+    """Return build(step.config), computed once per config dict.
+
+    Later runs reuse the result; assign a new dict to step.config to change it.
+    """
+    cached = step.__dict__.get("_frozen")
+    if cached is None or cached[0] is not step.config:
+        cached = step._frozen = (step.config, build(step.config))
+    return cached[1]
+
+
+def run_cmd(step: Step, suffix: str, cmd: List[str], cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Run `cmd` as a CommandStep `<step.id>__<suffix>` with the standard cwd/env/timeout/retries config.
+
+    The inner CommandStep is kept on `step` and reused by later runs (retries,
+    pipeline replays) as long as its config and data are unchanged.
+    """
+    config = {key: cfg.get(key) for key in _PASSTHROUGH}
+    config["cmd"] = cmd
+    config["retries"] = cfg.get("retries", 0)
+    inner = step.__dict__.setdefault("_inner_steps", {})
+    cs = inner.get(suffix)
+    if cs is None or cs.config != config or cs.data is not step.data:
+        cs = inner[suffix] = CommandStep(id=f"{step.id}__{suffix}", config=config, data=step.data)
+    cs.show = step.show
+    cs._output_buffer = step._output_buffer
+    return cs.run()
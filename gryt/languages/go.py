@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from ..step import CommandStep, Step
+from ..step import Step
+from ._common import run_cmd
 
 
 class GoModDownloadStep(Step):
@@ -18,22 +19,7 @@ class GoModDownloadStep(Step):
     def run(self) -> Dict[str, Any]:
         cfg = self.config
         cmd = ["go", "mod", "download"]
-        _cs = CommandStep(
-            id=f"{self.id}__gomoddownload",
-            config={
-                "cmd": cmd,
-                "cwd": cfg.get("cwd"),
-                "env": cfg.get("env"),
-                "timeout": cfg.get("timeout"),
-                "retries": cfg.get("retries", 0),
-            },
-            data=self.data,
-        )
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        return _cs.run()
+        return run_cmd(self, "gomoddownload", cmd, cfg)
 
 
 class GoBuildStep(Step):
@@ -57,22 +43,7 @@ class GoBuildStep(Step):
             cmd += ["-o", output]
         cmd += packages
 
-        _cs = CommandStep(
-            id=f"{self.id}__gobuild",
-            config={
-                "cmd": cmd,
-                "cwd": cfg.get("cwd"),
-                "env": cfg.get("env"),
-                "timeout": cfg.get("timeout"),
-                "retries": cfg.get("retries", 0),
-            },
-            data=self.data,
-        )
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        return _cs.run()
+        return run_cmd(self, "gobuild", cmd, cfg)
 
 
 class GoTestStep(Step):
@@ -96,19 +67,4 @@ class GoTestStep(Step):
             cmd += ["-json"]
         cmd += packages
 
-        _cs = CommandStep(
-            id=f"{self.id}__gotest",
-            config={
-                "cmd": cmd,
-                "cwd": cfg.get("cwd"),
-                "env": cfg.get("env"),
-                "timeout": cfg.get("timeout"),
-                "retries": cfg.get("retries", 0),
-            },
-            data=self.data,
-        )
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        return _cs.run()
+        return run_cmd(self, "gotest", cmd, cfg)
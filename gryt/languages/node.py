@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from ..step import CommandStep, Step
+from ..step import Step
+from ._common import run_cmd
 
 
 class NpmInstallStep(Step):
@@ -32,10 +33,13 @@ class NpmInstallStep(Step):
         # Select lock files depending on package manager
         lock_files = ["pnpm-lock.yaml"] if pm == "pnpm" else ["package-lock.json", "npm-shrinkwrap.json"]
 
-        if cwd:
-            lock_exists = any(os.path.exists(os.path.join(cwd, fname)) for fname in lock_files)
-        else:
-            lock_exists = any(os.path.exists(fname) for fname in lock_files)
+        # One directory listing instead of a stat() per candidate lock file
+        try:
+            with os.scandir(cwd or ".") as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+        lock_exists = not names.isdisjoint(lock_files)
 
         # Determine the command to use
         if pm == "pnpm":
@@ -47,23 +51,7 @@ class NpmInstallStep(Step):
         # Track whether we used the stricter/frozen variant to allow a fallback
         used_strict = (use_ci and lock_exists)
 
-        _cs = CommandStep(
-            id=f"{self.id}__npminstall",
-            config={
-                "cmd": cmd,
-                "cwd": cwd,
-                "env": cfg.get("env"),
-                "timeout": cfg.get("timeout"),
-                "retries": cfg.get("retries", 0),
-            },
-            data=self.data,
-        )
-        
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        result = _cs.run()
+        result = run_cmd(self, "npminstall", cmd, cfg)
         try:
             # annotate for easier debugging
             result["executed_cmd"] = " ".join(cmd)
@@ -73,22 +61,7 @@ class NpmInstallStep(Step):
         # If the strict mode failed, try a best-effort install with the same package manager
         if used_strict and result.get("status") == "error" and result.get("returncode") == 1:
             fallback_cmd = ["pnpm", "install"] if pm == "pnpm" else ["npm", "install"]
-            fallback_cs = CommandStep(
-                id=f"{self.id}__npminstall_fallback",
-                config={
-                    "cmd": fallback_cmd,
-                    "cwd": cwd,
-                    "env": cfg.get("env"),
-                    "timeout": cfg.get("timeout"),
-                    "retries": cfg.get("retries", 0),
-                },
-                data=self.data,
-            )
-            try:
-                setattr(fallback_cs, "show", bool(getattr(self, "show", False)))
-            except Exception:
-                pass
-            fb_res = fallback_cs.run()
+            fb_res = run_cmd(self, "npminstall_fallback", fallback_cmd, cfg)
             try:
                 fb_res["executed_cmd"] = " ".join(fallback_cmd)
             except Exception:
@@ -110,19 +83,7 @@ class NpmBuildStep(Step):
         script = cfg.get("script", "build")
         package_manager = cfg.get("package_manager", "npm")
         cmd = [package_manager, "run", script]
-        _cs = CommandStep(
-            id=f"{self.id}__npmbuild",
-            config={
-                "cmd": cmd,
-                "cwd": cfg.get("cwd"),
-                "env": cfg.get("env"),
-            }
-        )
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        return _cs.run()
+        return run_cmd(self, "npmbuild", cmd, cfg)
 
 
 class SvelteBuildStep(Step):
@@ -137,19 +98,4 @@ class SvelteBuildStep(Step):
         cfg = self.config
         script = cfg.get("script", "build")
         cmd = ["npm", "run", script]
-        _cs = CommandStep(
-            id=f"{self.id}__sveltebuild",
-            config={
-                "cmd": cmd,
-                "cwd": cfg.get("cwd"),
-                "env": cfg.get("env"),
-                "timeout": cfg.get("timeout"),
-                "retries": cfg.get("retries", 0),
-            },
-            data=self.data,
-        )
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        return _cs.run()
+        return run_cmd(self, "sveltebuild", cmd, cfg)
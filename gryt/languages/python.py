@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from ..step import CommandStep, Step
+from ..step import Step
+from ._common import run_cmd
 
 
 class PipInstallStep(Step):
@@ -33,22 +34,7 @@ class PipInstallStep(Step):
         else:
             cmd += packages
 
-        _cs = CommandStep(
-            id=f"{self.id}__pipinstall",
-            config={
-                "cmd": cmd,
-                "cwd": cfg.get("cwd"),
-                "env": cfg.get("env"),
-                "timeout": cfg.get("timeout"),
-                "retries": cfg.get("retries", 0),
-            },
-            data=self.data,
-        )
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        return _cs.run()
+        return run_cmd(self, "pipinstall", cmd, cfg)
 
 
 class PytestStep(Step):
@@ -67,19 +53,4 @@ class PytestStep(Step):
 
         cmd: List[str] = ["pytest"] + args + paths
 
-        _cs = CommandStep(
-            id=f"{self.id}__pytest",
-            config={
-                "cmd": cmd,
-                "cwd": cfg.get("cwd"),
-                "env": cfg.get("env"),
-                "timeout": cfg.get("timeout"),
-                "retries": cfg.get("retries", 0),
-            },
-            data=self.data,
-        )
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        return _cs.run()
+        return run_cmd(self, "pytest", cmd, cfg)
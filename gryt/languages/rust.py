@@ -1,8 +1,83 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import os
+import shutil
+import subprocess
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from ..step import CommandStep, Step
+from ..step import Step
+from ._common import frozen, run_cmd
+
+# (config key, flag) pairs emitted in this order when the key is truthy
+_CARGO_BUILD_FLAGS = (("release", "--release"), ("all_features", "--all-features"))
+_CARGO_TEST_FLAGS = (("release", "--release"), ("workspace", "--workspace"), ("all_features", "--all-features"))
+
+
+# Cargo.lock path -> (mtime_ns, size, sha256); rehashed only when the file changes
+_LOCK_DIGESTS: Dict[str, Tuple[int, int, str]] = {}
+
+# sccache binaries whose server this process has already started
+_SCCACHE_STARTED: Set[str] = set()
+
+
+def _cargo_lock_digest(cwd: str) -> Optional[str]:
+    path = os.path.join(cwd, "Cargo.lock")
+    try:
+        stat = os.stat(path)
+        cached = _LOCK_DIGESTS.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+    _LOCK_DIGESTS[path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def _start_sccache(sccache: str) -> None:
+    if sccache in _SCCACHE_STARTED:
+        return
+    # Exits non-zero when a server is already running, which is fine
+    subprocess.run([sccache, "--start-server"], capture_output=True, check=False)
+    _SCCACHE_STARTED.add(sccache)
+
+
+def _freeze_build(cfg: Dict[str, Any]) -> Tuple[List[str], Dict[str, str], Optional[str]]:
+    """(cmd, extra env, sccache path) for CargoBuildStep; sccache is None when not
+    requested and "" when requested but missing."""
+    get = cfg.get
+    features: List[str] = get("features") or []
+    target: Optional[str] = get("target")
+
+    cmd: List[str] = ["cargo", "build", *(flag for key, flag in _CARGO_BUILD_FLAGS if get(key))]
+    if features:
+        cmd += ["--features", ",".join(features)]
+    if target:
+        cmd += ["--target", target]
+
+    extra_env: Dict[str, str] = {}
+    if get("target_dir"):
+        extra_env["CARGO_TARGET_DIR"] = str(get("target_dir"))
+    if get("incremental") is not None:
+        extra_env["CARGO_INCREMENTAL"] = "1" if get("incremental") else "0"
+    sccache: Optional[str] = None
+    if get("sccache"):
+        sccache = shutil.which("sccache") or ""
+        if sccache:
+            extra_env["RUSTC_WRAPPER"] = sccache
+    return cmd, extra_env, sccache
+
+
+def _freeze_test(cfg: Dict[str, Any]) -> List[str]:
+    get = cfg.get
+    features: List[str] = get("features") or []
+    cmd: List[str] = ["cargo", "test", *(flag for key, flag in _CARGO_TEST_FLAGS if get(key))]
+    if features:
+        cmd += ["--features", ",".join(features)]
+    return cmd
 
 
 class CargoBuildStep(Step):
@@ -13,42 +88,46 @@ class CargoBuildStep(Step):
     - all_features: bool (optional) – if True, add '--all-features'
     - features: List[str] (optional) – pass as '--features <comma,separated>'
     - target: str (optional) – '--target <triple>'
+    - target_dir: str (optional) – persistent build dir, exported as CARGO_TARGET_DIR
+    - sccache: bool (optional) – if True, start sccache and use it as RUSTC_WRAPPER
+    - incremental: bool (optional) – force CARGO_INCREMENTAL on/off (default: cargo's profile default)
     - cwd, env, timeout, retries – standard
+
+    The command and the env keys it adds are derived from config on the first
+    run and reused after that; the base environment is read on every run and
+    the sccache server is started once per process. The result carries
+    `cache_key` (sha256 of Cargo.lock, when present) so CI can key a cached
+    target/ directory on the resolved dependency set.
     """
 
     def run(self) -> Dict[str, Any]:
+        start = time.time()
+        cmd, extra_env, sccache = frozen(self, _freeze_build)
+        if sccache is not None:
+            if not sccache:
+                result = {
+                    "status": "error",
+                    "error": "sccache requested but not found on PATH",
+                    "stdout": "",
+                    "stderr": "",
+                    "returncode": None,
+                    "duration": time.time() - start,
+                    "attempts": 0,
+                }
+                self._record_output(result, "", "")
+                return result
+            _start_sccache(sccache)
+
         cfg = self.config
-        release = bool(cfg.get("release", False))
-        all_features = bool(cfg.get("all_features", False))
-        features: List[str] = cfg.get("features") or []
-        target: Optional[str] = cfg.get("target")
-
-        cmd: List[str] = ["cargo", "build"]
-        if release:
-            cmd.append("--release")
-        if all_features:
-            cmd.append("--all-features")
-        if features:
-            cmd += ["--features", ",".join(features)]
-        if target:
-            cmd += ["--target", target]
-
-        _cs = CommandStep(
-            id=f"{self.id}__cargobuild",
-            config={
-                "cmd": cmd,
-                "cwd": cfg.get("cwd"),
-                "env": cfg.get("env"),
-                "timeout": cfg.get("timeout"),
-                "retries": cfg.get("retries", 0),
-            },
-            data=self.data,
-        )
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        return _cs.run()
+        if extra_env:
+            # CommandStep replaces the child environment wholesale, so extend the
+            # current base one on every run
+            cfg = {**cfg, "env": {**(cfg.get("env") or os.environ), **extra_env}}
+        result = run_cmd(self, "cargobuild", cmd, cfg)
+        cache_key = _cargo_lock_digest(cfg.get("cwd") or ".")
+        if cache_key:
+            result["cache_key"] = cache_key
+        return result
 
 
 class CargoTestStep(Step):
@@ -60,38 +139,9 @@ class CargoTestStep(Step):
     - features: List[str] (optional)
     - workspace: bool (optional) – if True, add '--workspace'
     - cwd, env, timeout, retries – standard
+
+    The command is derived from config on the first run and reused after that.
     """
 
     def run(self) -> Dict[str, Any]:
-        cfg = self.config
-        release = bool(cfg.get("release", False))
-        all_features = bool(cfg.get("all_features", False))
-        features: List[str] = cfg.get("features") or []
-        workspace = bool(cfg.get("workspace", False))
-
-        cmd: List[str] = ["cargo", "test"]
-        if release:
-            cmd.append("--release")
-        if workspace:
-            cmd.append("--workspace")
-        if all_features:
-            cmd.append("--all-features")
-        if features:
-            cmd += ["--features", ",".join(features)]
-
-        _cs = CommandStep(
-            id=f"{self.id}__cargotest",
-            config={
-                "cmd": cmd,
-                "cwd": cfg.get("cwd"),
-                "env": cfg.get("env"),
-                "timeout": cfg.get("timeout"),
-                "retries": cfg.get("retries", 0),
-            },
-            data=self.data,
-        )
-        try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
-        except Exception:
-            pass
-        return _cs.run()
+        return run_cmd(self, "cargotest", frozen(self, _freeze_test), self.config)
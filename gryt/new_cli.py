@@ -60,8 +60,7 @@ def cmd_new_project(
         # Initialize database
         gryt_dir = project_path / ".gryt"
         db_path = gryt_dir / "gryt.db"
-        data = SqliteData(db_path=str(db_path))
-        data.close()
+        SqliteData.initialize_schema_at(db_path)
 
         typer.echo(f"✓ Project created at {project_path}")
         typer.echo(f"\nNext steps:")
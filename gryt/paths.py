@@ -1,13 +1,42 @@
 """Path utilities for finding gryt repo root and config files."""
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 GRYT_DIRNAME = ".gryt"
 GIT_DIRNAME = ".git"
 
+# Resolved start directory -> repo root. Only successful lookups are cached
+# (so a later `gryt init` is seen immediately), and a hit is re-validated with
+# a single stat of <root>/.gryt.
+_REPO_ROOT_CACHE: Dict[str, str] = {}
+_REPO_ROOT_CACHE_MAX = 128
+
+# (os.getcwd(), its realpath) from the last lookup that started at the cwd.
+# getcwd() is still called every time, so a chdir is always noticed; only the
+# realpath() resolution (an lstat per path component) is skipped.
+_CWD_REALPATH: Optional[Tuple[str, str]] = None
+
+
+def clear_cache() -> None:
+    """Forget cached repo-root lookups."""
+    global _CWD_REALPATH
+    _REPO_ROOT_CACHE.clear()
+    _CWD_REALPATH = None
+
+
+def _resolved_cwd() -> str:
+    global _CWD_REALPATH
+    cwd = os.getcwd()
+    cached = _CWD_REALPATH
+    if cached is None or cached[0] != cwd:
+        cached = _CWD_REALPATH = (cwd, os.path.realpath(cwd))
+    return cached[1]
+
 
 def find_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
     """Find the gryt repository root by walking up the directory tree.
@@ -27,30 +56,46 @@ def find_repo_root(start_path: Optional[Path] = None) -> Optional[Path]:
         >>> print(root)
         /path/to/REPO
     """
-    if start_path is None:
-        start_path = Path.cwd()
-
-    current = start_path.resolve()
-
-    # Walk up the directory tree
-    for parent in [current] + list(current.parents):
-        gryt_dir = parent / GRYT_DIRNAME
-        git_dir = parent / GIT_DIRNAME
-
+    current = _resolved_cwd() if start_path is None else os.path.realpath(start_path)
+
+    cached = _REPO_ROOT_CACHE.get(current)
+    if cached is not None:
+        if os.path.isdir(os.path.join(cached, GRYT_DIRNAME)):
+            return Path(cached)
+        del _REPO_ROOT_CACHE[current]
+
+    # Walk up the directory tree on plain strings: one stat per check, and no
+    # Path objects until a root is found
+    parent = current
+    while True:
         # Found .gryt folder
-        if gryt_dir.exists() and gryt_dir.is_dir():
+        if os.path.isdir(os.path.join(parent, GRYT_DIRNAME)):
             # Safety check: ensure .git exists at same level
-            if git_dir.exists() and git_dir.is_dir():
-                return parent
+            if os.path.isdir(os.path.join(parent, GIT_DIRNAME)):
+                if len(_REPO_ROOT_CACHE) >= _REPO_ROOT_CACHE_MAX:
+                    _REPO_ROOT_CACHE.clear()
+                _REPO_ROOT_CACHE[current] = parent
+                return Path(parent)
 
             # Found .gryt but no .git - this might be a nested .gryt folder
             # Continue searching up, but warn
             # (We could log a warning here if we had logging configured)
-            continue
+
+        grandparent = os.path.dirname(parent)
+        if grandparent == parent:
+            break
+        parent = grandparent
 
     return None
 
 
+@lru_cache(maxsize=32)
+def _paths_under(root: Path) -> Tuple[Path, Path, Path]:
+    """(.gryt dir, config path, db path) for a repo root, built once per root."""
+    gryt_dir = root / GRYT_DIRNAME
+    return gryt_dir, gryt_dir / "config", gryt_dir / "gryt.db"
+
+
 def get_repo_gryt_dir(start_path: Optional[Path] = None) -> Optional[Path]:
     """Get the .gryt directory for the current repo.
 
@@ -62,7 +107,7 @@ def get_repo_gryt_dir(start_path: Optional[Path] = None) -> Optional[Path]:
     """
     root = find_repo_root(start_path)
     if root:
-        return root / GRYT_DIRNAME
+        return _paths_under(root)[0]
     return None
 
 
@@ -75,9 +120,9 @@ def get_repo_config_path(start_path: Optional[Path] = None) -> Optional[Path]:
     Returns:
         Path to .gryt/config file, or None if not in a gryt repo
     """
-    gryt_dir = get_repo_gryt_dir(start_path)
-    if gryt_dir:
-        return gryt_dir / "config"
+    root = find_repo_root(start_path)
+    if root:
+        return _paths_under(root)[1]
     return None
 
 
@@ -90,9 +135,9 @@ def get_repo_db_path(start_path: Optional[Path] = None) -> Optional[Path]:
     Returns:
         Path to .gryt/gryt.db file, or None if not in a gryt repo
     """
-    gryt_dir = get_repo_gryt_dir(start_path)
-    if gryt_dir:
-        return gryt_dir / "gryt.db"
+    root = find_repo_root(start_path)
+    if root:
+        return _paths_under(root)[2]
     return None
 
 
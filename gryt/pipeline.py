@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import concurrent.futures
+import logging
+import pickle
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .data import Data
@@ -11,6 +13,27 @@ from .versioning import Versioning
 if TYPE_CHECKING:
     from .auth import Auth
 
+logger = logging.getLogger(__name__)
+
+# parallel_kind -> executor class for runners. Sub-interpreters need Python 3.14+;
+# without them runners fall back to threads.
+_RUNNER_EXECUTORS = {
+    "thread": concurrent.futures.ThreadPoolExecutor,
+    "process": concurrent.futures.ProcessPoolExecutor,
+    "interpreter": getattr(concurrent.futures, "InterpreterPoolExecutor", concurrent.futures.ThreadPoolExecutor),
+}
+
+# Result keys for the first 64 runners, built once instead of per execute()
+_RUNNER_KEYS = tuple(f"runner_{i}" for i in range(64))
+
+
+def _runner_key(i: int) -> str:
+    return _RUNNER_KEYS[i] if i < len(_RUNNER_KEYS) else f"runner_{i}"
+
+
+# Shared report for a clean environment; treat as read-only
+_OK_REPORT: Dict[str, Any] = {"status": "ok", "issues": []}
+
 
 class Pipeline:
     """Compose multiple runners into a pipeline."""
@@ -25,7 +48,10 @@ class Pipeline:
         destinations: Optional[List["Destination"]] = None,
         validators: Optional[List["EnvValidator"]] = None,
         auth_steps: Optional[List["Auth"]] = None,
+        parallel_kind: str = "thread",
     ) -> None:
+        if parallel_kind not in _RUNNER_EXECUTORS:
+            raise ValueError(f"Unsupported parallel_kind: {parallel_kind}")
         self.runners = runners
         self.data = data
         self.runtime = runtime
@@ -34,38 +60,149 @@ class Pipeline:
         self.destinations = destinations or []
         self.validators = validators or []
         self.auth_steps = auth_steps or []
+        self._prepared = False
+        self._show: Optional[bool] = None
+        self.parallel_kind = parallel_kind
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._runner_executor: Optional[concurrent.futures.Executor] = None
+        self._runners_picklable: Optional[bool] = None
+
+    def validate_environment(self, fail_fast: bool = False) -> Dict[str, Any]:
+        """Run all configured validators and return a report without raising.
 
-    def validate_environment(self) -> Dict[str, Any]:
-        """Run all configured validators and return a report without raising."""
-        issues: List[Dict[str, Any]] = []
-        for v in self.validators:
+        Validators run concurrently on the pipeline's worker pool; issues are
+        reported in validator order. With fail_fast, validators that have not
+        started yet are cancelled once any validator reports an issue.
+
+        A clean run returns a shared, read-only report.
+        """
+        if not self.validators:
+            return _OK_REPORT
+        if len(self.validators) == 1:
+            per_validator = [self._run_validator(v) for v in self.validators]
+        else:
+            ex = self._get_executor()
+            futures = {ex.submit(self._run_validator, v): i for i, v in enumerate(self.validators)}
+            collected: Dict[int, List[Dict[str, Any]]] = {}
+            for fut in concurrent.futures.as_completed(futures):
+                collected[futures[fut]] = fut.result()
+                if fail_fast and collected[futures[fut]]:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+            per_validator = [collected[i] for i in sorted(collected)]
+        issues = [iss for found in per_validator for iss in found]
+        if not issues:
+            return _OK_REPORT
+        return {"status": "invalid_env", "issues": issues}
+
+    def _publish(self, artifacts: List["PathLike"]) -> Dict[str, Any]:
+        """Publish artifacts to every destination; uploads overlap when there are several."""
+        if len(self.destinations) == 1:
+            outcomes = [self._publish_one(self.destinations[0], artifacts)]
+        else:
+            ex = self._get_executor()
+            futures = [ex.submit(self._publish_one, dest, artifacts) for dest in self.destinations]
+            concurrent.futures.wait(futures)
+            outcomes = [fut.result() for fut in futures]
+        # Keyed in destination order regardless of which upload finished first
+        return {dest.id: res for dest, res in zip(self.destinations, outcomes)}
+
+    @staticmethod
+    def _publish_one(dest: "Destination", artifacts: List["PathLike"]) -> Any:
+        try:
+            return dest.publish(artifacts)
+        except Exception as e:  # noqa: BLE001
+            return [{"status": "error", "error": str(e)}]
+
+    @staticmethod
+    def _run_validator(v: "EnvValidator") -> List[Dict[str, Any]]:
+        try:
+            return [
+                {
+                    "kind": getattr(iss, "kind", "unknown"),
+                    "name": getattr(iss, "name", ""),
+                    "message": getattr(iss, "message", ""),
+                    "details": getattr(iss, "details", None),
+                }
+                for iss in v.run()
+            ]
+        except Exception as e:  # noqa: BLE001
+            return [{"kind": "validator_error", "name": type(v).__name__, "message": str(e)}]
+
+    def __enter__(self) -> Pipeline:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pools used for parallel execution, if any."""
+        if self._runner_executor is not None:
+            self._runner_executor.shutdown(wait=True)
+            self._runner_executor = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        # Created on the first parallel run and reused by later ones
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(32, max(len(self.runners), len(self.validators), len(self.destinations), 1)), thread_name_prefix="gryt-runner"
+            )
+        return self._executor
+
+    def _get_runner_executor(self) -> concurrent.futures.Executor:
+        # Threads share the general pool; process/interpreter pools are kept
+        # apart because validators and destinations are not picklable
+        executor_cls = _RUNNER_EXECUTORS[self.parallel_kind]
+        if executor_cls is concurrent.futures.ThreadPoolExecutor or not self._can_pickle_runners():
+            return self._get_executor()
+        if self._runner_executor is None:
+            self._runner_executor = executor_cls(max_workers=min(32, len(self.runners) or 1))
+        return self._runner_executor
+
+    def _can_pickle_runners(self) -> bool:
+        """Whether runners can be sent to a process/interpreter pool (checked once).
+
+        Steps holding a Data store carry an SQLite connection, which cannot be
+        pickled, and rows written in a worker would never reach this process;
+        such pipelines run their runners on threads instead.
+        """
+        if self._runners_picklable is None:
             try:
-                for iss in v.run():
-                    issues.append(
-                        {
-                            "kind": getattr(iss, "kind", "unknown"),
-                            "name": getattr(iss, "name", ""),
-                            "message": getattr(iss, "message", ""),
-                            "details": getattr(iss, "details", None),
-                        }
-                    )
+                pickle.dumps(self.runners)
+                self._runners_picklable = True
             except Exception as e:  # noqa: BLE001
-                issues.append({"kind": "validator_error", "name": type(v).__name__, "message": str(e)})
-        return {"status": "ok" if not issues else "invalid_env", "issues": issues}
+                logger.warning(f"Runners cannot run with parallel_kind={self.parallel_kind!r} ({e}); using threads")
+                self._runners_picklable = False
+        return self._runners_picklable
 
-    def execute(self, parallel: bool = False, artifacts: Optional[List["PathLike"]] = None, show: bool = False) -> Dict[str, Any]:
-        # Inject pipeline-level hook and data into steps if missing
+    def _prepare_steps(self, show: bool) -> None:
+        """Inject pipeline-level hook and data into steps if missing and propagate show.
+
+        The walk runs once per pipeline; later executions only revisit steps
+        when the show flag changes.
+        """
+        if self._prepared and show == self._show:
+            return
+        data, hook = self.data, self.hook
+        inject = not self._prepared and (data is not None or hook is not None)
         for r in self.runners:
             for s in getattr(r, "steps", []):
-                if self.data is not None and s.data is None:
-                    s.data = self.data
-                if self.hook is not None and getattr(s, "hook", None) is None:
-                    s.hook = self.hook
+                if inject:
+                    if data is not None and s.data is None:
+                        s.data = data
+                    if hook is not None and s.hook is None:
+                        s.hook = hook
                 # Propagate show flag to steps (used by CommandStep to dump output)
-                try:
-                    setattr(s, "show", bool(show))
-                except Exception:
-                    pass
+                s.show = show
+        self._prepared = True
+        self._show = show
+
+    def execute(self, parallel: bool = False, artifacts: Optional[List["PathLike"]] = None, show: bool = False) -> Dict[str, Any]:
+        self._prepare_steps(bool(show))
         # Pre-run environment validation (aggregate issues, no fail-fast)
         if self.validators:
             env_report = self.validate_environment()
@@ -96,34 +233,28 @@ class Pipeline:
         if self.runtime:
             self.runtime.provision()
         try:
-            if parallel:
-                with concurrent.futures.ThreadPoolExecutor() as ex:
-                    futures = [ex.submit(r.execute) for r in self.runners]
-                    results = {f"runner_{i}": fut.result() for i, fut in enumerate(futures)}
+            if parallel and self.runners:
+                ex = self._get_runner_executor()
+                futures = [ex.submit(r.execute) for r in self.runners]
+                # Let every runner finish before surfacing the first error
+                concurrent.futures.wait(futures)
+                results = {_runner_key(i): fut.result() for i, fut in enumerate(futures)}
             else:
-                results = {f"runner_{i}": r.execute() for i, r in enumerate(self.runners)}
+                results = {_runner_key(i): r.execute() for i, r in enumerate(self.runners)}
+            # One combined result, shared by the hook and the return value
+            final: Dict[str, Any] = {"runners": results}
             # Optional publishing to destinations
-            publish_results: Dict[str, Any] = {}
             if self.destinations and artifacts:
-                for dest in self.destinations:
-                    try:
-                        dest_res = dest.publish(artifacts)
-                        publish_results[dest.id] = dest_res
-                    except Exception as e:  # noqa: BLE001
-                        publish_results[dest.id] = [{"status": "error", "error": str(e)}]
+                publish_results = self._publish(artifacts)
+                if publish_results:
+                    final["destinations"] = publish_results
             if self.hook:
                 try:
-                    # enrich results with publish info if present
-                    final = {"runners": results}
-                    if publish_results:
-                        final["destinations"] = publish_results
                     self.hook.on_pipeline_end(self, final, context=None)
                 except Exception:
                     pass
-            # Return combined results
-            if publish_results:
-                return {"runners": results, "destinations": publish_results}
-            return results
+            # Without destinations the bare runner results are returned
+            return final if "destinations" in final else results
         except Exception as e:  # noqa: BLE001
             if self.hook:
                 try:
@@ -1,12 +1,17 @@
 """
 Pipeline template generators for change validation (v1.0.4)
 """
+from functools import lru_cache
 from typing import Optional
 
 
+_SANITIZE_TABLE = str.maketrans({"-": "_", " ": "_"})
+
+
+@lru_cache(maxsize=1024)
 def sanitize_change_id(change_id: str) -> str:
     """Convert change ID to valid Python filename/identifier"""
-    return change_id.replace("-", "_").replace(" ", "_").upper()
+    return change_id.translate(_SANITIZE_TABLE).upper()
 
 
 def generate_pipeline_template(
@@ -27,10 +32,21 @@ def generate_pipeline_template(
     Returns:
         Python code for the validation pipeline
     """
-    sanitized_id = sanitize_change_id(change_id)
+    description_block = f"Description: {description}" if description else ""
+    header = _HEADER_TEMPLATE.format(
+        change_id=change_id, title=title, change_type=change_type, description_block=description_block
+    )
+
+    # Type-specific pipeline logic
+    body = _BODY_TEMPLATES.get(change_type, _GENERIC_TEMPLATE)
+    return header + body.format(
+        lower_id=sanitize_change_id(change_id).lower(), change_id=change_id, title=title
+    )
+
 
-    # Common header
-    header = '''#!/usr/bin/env python3
+# Plain str.format templates (not f-strings): the literal text is built once at
+# import and each call only substitutes change_id, title and lower_id
+_HEADER_TEMPLATE = '''#!/usr/bin/env python3
 """
 Validation pipeline for {change_id}: {title}
 
@@ -39,31 +55,11 @@ Change Type: {change_type}
 """
 from gryt import LocalRuntime, Pipeline, Runner, SqliteData, CommandStep
 
-'''.format(
-        change_id=change_id,
-        title=title,
-        change_type=change_type,
-        description_block=f"Description: {description}" if description else "",
-    )
+'''
 
-    # Type-specific pipeline logic
-    if change_type == "add":
-        template = _generate_add_template(sanitized_id, change_id, title)
-    elif change_type == "fix":
-        template = _generate_fix_template(sanitized_id, change_id, title)
-    elif change_type == "refine":
-        template = _generate_refine_template(sanitized_id, change_id, title)
-    elif change_type == "remove":
-        template = _generate_remove_template(sanitized_id, change_id, title)
-    else:
-        template = _generate_generic_template(sanitized_id, change_id, title)
-
-    return header + template
-
-
-def _generate_add_template(sanitized_id: str, change_id: str, title: str) -> str:
-    """Generate template for 'add' change type (new feature)"""
-    return f'''# Feature validation pipeline for {change_id}
+
+# Body for 'add' change type (new feature)
+_ADD_TEMPLATE = '''# Feature validation pipeline for {change_id}
 # This pipeline validates the new feature: {title}
 #
 # Recommended steps:
@@ -81,7 +77,7 @@ runner = Runner([
     CommandStep(
         id="unit_tests",
         config={{
-            'cmd': ['pytest', 'tests/test_{sanitized_id.lower()}.py', '-v'],
+            'cmd': ['pytest', 'tests/test_{lower_id}.py', '-v'],
             'cwd': '.',
         }},
         data=data
@@ -89,7 +85,7 @@ runner = Runner([
     CommandStep(
         id="integration_tests",
         config={{
-            'cmd': ['pytest', 'tests/integration/test_{sanitized_id.lower()}_integration.py', '-v'],
+            'cmd': ['pytest', 'tests/integration/test_{lower_id}_integration.py', '-v'],
             'cwd': '.',
         }},
         data=data
@@ -108,9 +104,8 @@ PIPELINE = Pipeline([runner], data=data, runtime=runtime)
 '''
 
 
-def _generate_fix_template(sanitized_id: str, change_id: str, title: str) -> str:
-    """Generate template for 'fix' change type (bug fix)"""
-    return f'''# Bug fix validation pipeline for {change_id}
+# Body for 'fix' change type (bug fix)
+_FIX_TEMPLATE = '''# Bug fix validation pipeline for {change_id}
 # This pipeline validates the bug fix: {title}
 #
 # Recommended steps:
@@ -127,7 +122,7 @@ runner = Runner([
     CommandStep(
         id="regression_test",
         config={{
-            'cmd': ['pytest', 'tests/regression/test_{sanitized_id.lower()}_bug.py', '-v'],
+            'cmd': ['pytest', 'tests/regression/test_{lower_id}_bug.py', '-v'],
             'cwd': '.',
         }},
         data=data
@@ -154,9 +149,8 @@ PIPELINE = Pipeline([runner], data=data, runtime=runtime)
 '''
 
 
-def _generate_refine_template(sanitized_id: str, change_id: str, title: str) -> str:
-    """Generate template for 'refine' change type (improvement)"""
-    return f'''# Refinement validation pipeline for {change_id}
+# Body for 'refine' change type (improvement)
+_REFINE_TEMPLATE = '''# Refinement validation pipeline for {change_id}
 # This pipeline validates the refinement: {title}
 #
 # Recommended steps:
@@ -181,7 +175,7 @@ runner = Runner([
     CommandStep(
         id="benchmark",
         config={{
-            'cmd': ['pytest', 'tests/benchmarks/test_{sanitized_id.lower()}_perf.py', '--benchmark-only'],
+            'cmd': ['pytest', 'tests/benchmarks/test_{lower_id}_perf.py', '--benchmark-only'],
             'cwd': '.',
         }},
         data=data
@@ -189,7 +183,7 @@ runner = Runner([
     CommandStep(
         id="load_test",
         config={{
-            'cmd': ['locust', '-f', 'tests/load/test_{sanitized_id.lower()}_load.py', '--headless', '-u', '100', '-r', '10', '-t', '1m'],
+            'cmd': ['locust', '-f', 'tests/load/test_{lower_id}_load.py', '--headless', '-u', '100', '-r', '10', '-t', '1m'],
             'cwd': '.',
         }},
         data=data
@@ -200,9 +194,8 @@ PIPELINE = Pipeline([runner], data=data, runtime=runtime)
 '''
 
 
-def _generate_remove_template(sanitized_id: str, change_id: str, title: str) -> str:
-    """Generate template for 'remove' change type (deprecation/removal)"""
-    return f'''# Removal validation pipeline for {change_id}
+# Body for 'remove' change type (deprecation/removal)
+_REMOVE_TEMPLATE = '''# Removal validation pipeline for {change_id}
 # This pipeline validates the removal/deprecation: {title}
 #
 # Recommended steps:
@@ -219,7 +212,7 @@ runner = Runner([
     CommandStep(
         id="check_references",
         config={{
-            'cmd': ['grep', '-r', '{sanitized_id.lower()}', 'src/'],
+            'cmd': ['grep', '-r', '{lower_id}', 'src/'],
             'cwd': '.',
         }},
         data=data
@@ -246,9 +239,8 @@ PIPELINE = Pipeline([runner], data=data, runtime=runtime)
 '''
 
 
-def _generate_generic_template(sanitized_id: str, change_id: str, title: str) -> str:
-    """Generate generic template for unknown change types"""
-    return f'''# Validation pipeline for {change_id}
+# Body for unknown change types
+_GENERIC_TEMPLATE = '''# Validation pipeline for {change_id}
 # This pipeline validates: {title}
 #
 # TODO: Customize this pipeline based on your specific needs
@@ -277,3 +269,12 @@ runner = Runner([
 
 PIPELINE = Pipeline([runner], data=data, runtime=runtime)
 '''
+
+
+# change_type -> body template; anything else gets the generic template
+_BODY_TEMPLATES = {
+    "add": _ADD_TEMPLATE,
+    "fix": _FIX_TEMPLATE,
+    "refine": _REFINE_TEMPLATE,
+    "remove": _REMOVE_TEMPLATE,
+}
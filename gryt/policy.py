@@ -5,13 +5,44 @@ Policies enforce rules on generation changes and evolutions.
 """
 from __future__ import annotations
 
+import copy
 import json
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .data import SqliteData
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed and schema-validated policy YAML keyed by resolved path, stored with
+# the file's (mtime_ns, size) so an edited file is re-read. Policies are built
+# from a deep copy on every load because callers may mutate their config.
+_YAML_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+_SQL_EVOLUTION_COUNT = """
+    SELECT COUNT(*) FROM evolutions
+    WHERE generation_id = ? AND change_id = ?
+"""
+
+
+@lru_cache(maxsize=1)
+def _load_policy_schema() -> Optional[Dict[str, Any]]:
+    """Parsed schemas/policy.json, read once per process (None if missing)."""
+    schema_path = Path(__file__).parent / "schemas" / "policy.json"
+    if not schema_path.exists():
+        return None
+    return json.loads(schema_path.read_text())
+
+
+def _count_evolutions(data: SqliteData, change_id: str, generation_id: str) -> int:
+    row = data.query_one(_SQL_EVOLUTION_COUNT, (generation_id, change_id))
+    return row[0] if row else 0
+
 
 class PolicyViolation(Exception):
     """Raised when a policy is violated"""
@@ -44,17 +75,15 @@ class Policy:
         self.type = policy_type
         self.enabled = enabled
         self.config = config or {}
+        self._change_types = frozenset(self.config.get("change_types") or ())
 
     def applies_to(self, change_type: str) -> bool:
         """Check if this policy applies to a given change type"""
         if not self.enabled:
             return False
 
-        change_types = self.config.get("change_types", [])
-        if not change_types:
-            return True  # Applies to all if not specified
-
-        return change_type in change_types
+        # Applies to all if not specified
+        return not self._change_types or change_type in self._change_types
 
     def validate(
         self,
@@ -62,11 +91,15 @@ class Policy:
         change_id: str,
         generation_id: str,
         data: SqliteData,
-        pipeline_steps: Optional[List[str]] = None
+        pipeline_steps: Optional[List[str]] = None,
+        evolution_count: Optional[int] = None
     ) -> None:
         """
         Validate this policy for a change.
 
+        evolution_count, when given, is used instead of querying the
+        evolutions table (PolicySet counts once for all its policies).
+
         Raises PolicyViolation if validation fails.
         """
         if not self.applies_to(change_type):
@@ -75,7 +108,7 @@ class Policy:
         if self.type == "change_type":
             self._validate_change_type(change_type, change_id, pipeline_steps)
         elif self.type == "evolution_count":
-            self._validate_evolution_count(change_id, generation_id, data)
+            self._validate_evolution_count(change_id, generation_id, data, evolution_count)
 
     def _validate_change_type(
         self,
@@ -95,7 +128,8 @@ class Policy:
                 {"required_steps": required_steps, "change_type": change_type}
             )
 
-        missing_steps = [s for s in required_steps if s not in pipeline_steps]
+        step_set = pipeline_steps if isinstance(pipeline_steps, (set, frozenset)) else frozenset(pipeline_steps)
+        missing_steps = [s for s in required_steps if s not in step_set]
         if missing_steps:
             raise PolicyViolation(
                 self.name,
@@ -112,20 +146,14 @@ class Policy:
         self,
         change_id: str,
         generation_id: str,
-        data: SqliteData
+        data: SqliteData,
+        count: Optional[int] = None
     ) -> None:
         """Validate evolution count policies"""
         min_evolutions = self.config.get("min_evolutions", 1)
 
-        evolutions = data.query(
-            """
-            SELECT COUNT(*) as count FROM evolutions
-            WHERE generation_id = ? AND change_id = ?
-            """,
-            (generation_id, change_id)
-        )
-
-        count = evolutions[0]["count"] if evolutions else 0
+        if count is None:
+            count = _count_evolutions(data, change_id, generation_id)
 
         if count < min_evolutions:
             raise PolicyViolation(
@@ -165,6 +193,8 @@ class PolicySet:
 
     def __init__(self, policies: List[Policy]):
         self.policies = policies
+        # change_type -> policies that apply to it, filled in on first use
+        self._applicable_by_type: Dict[str, List[Policy]] = {}
 
     @classmethod
     def from_yaml_file(cls, yaml_path: Path) -> PolicySet:
@@ -172,13 +202,19 @@ class PolicySet:
         if not yaml_path.exists():
             return cls([])
 
-        with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+        path = Path(yaml_path).resolve()
+        stat = path.stat()
+        cached = _YAML_CACHE.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            data = cached[2]
+        else:
+            data = yaml.load(path.read_bytes(), Loader=_SafeLoader)
 
-        # Validate against JSON schema
-        cls._validate_schema(data)
+            # Validate against JSON schema
+            cls._validate_schema(data)
+            _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
 
-        policies = [Policy.from_dict(p) for p in data.get("policies", [])]
+        policies = [Policy.from_dict(p) for p in copy.deepcopy(data.get("policies", []))]
         return cls(policies)
 
     def validate_all(
@@ -192,13 +228,29 @@ class PolicySet:
         """
         Validate all policies, collecting violations.
 
+        The policies applying to each change type are looked up once per
+        PolicySet, so policies are treated as fixed after construction.
+
         Returns a list of violations (empty if all pass).
         """
         violations = []
-
-        for policy in self.policies:
+        # Shared by every evolution_count policy; queried on first need only
+        evolution_count: Optional[int] = None
+
+        applicable = self._applicable_by_type.get(change_type)
+        if applicable is None:
+            applicable = self._applicable_by_type[change_type] = [
+                p for p in self.policies if p.applies_to(change_type)
+            ]
+
+        for policy in applicable:
+            if evolution_count is None and policy.type == "evolution_count":
+                evolution_count = _count_evolutions(data, change_id, generation_id)
             try:
-                policy.validate(change_type, change_id, generation_id, data, pipeline_steps)
+                policy.validate(
+                    change_type, change_id, generation_id, data, pipeline_steps,
+                    evolution_count=evolution_count,
+                )
             except PolicyViolation as e:
                 violations.append(e)
 
@@ -218,13 +270,10 @@ class PolicySet:
         except ImportError:
             return
 
-        schema_path = Path(__file__).parent / "schemas" / "policy.json"
-        if not schema_path.exists():
+        schema = _load_policy_schema()
+        if schema is None:
             return
 
-        with open(schema_path, "r") as f:
-            schema = json.load(f)
-
         jsonschema.validate(data, schema)
 
 
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import fnmatch
 import glob
+import os
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from .step import Step
 from .destination import Destination
 
 PathLike = Union[str, Path]
 
+_GLOB_CHARS = frozenset("*?[]")
+
+
+def _simple_glob(pattern: str) -> Optional[Tuple[str, str]]:
+    """(parent, name pattern) when only the last component has wildcards, else None."""
+    parent, name = os.path.split(pattern)
+    if not name or "**" in pattern or not _GLOB_CHARS.isdisjoint(parent):
+        return None
+    return parent, name
+
 
 class PublishDestinationStep(Step):
     """
@@ -31,16 +43,35 @@ class PublishDestinationStep(Step):
     ) -> None:
         super().__init__(id=id, config=config, data=data, hook=hook)
         self.destination = destination
-        self.artifacts = list(artifacts)
+        self.artifacts: List[str] = [os.fspath(a) for a in artifacts]
+        # (path or pattern, is_glob, simple split) in the given order, classified once
+        self._artifact_specs = []
+        for s in self.artifacts:
+            is_glob = not _GLOB_CHARS.isdisjoint(s)
+            self._artifact_specs.append((s, is_glob, _simple_glob(s) if is_glob else None))
 
     def _expand_artifacts(self) -> List[str]:
         files: List[str] = []
-        for a in self.artifacts:
-            s = str(a)
-            if any(ch in s for ch in "*?[]"):
-                files.extend(glob.glob(s))
-            else:
+        # Patterns sharing a parent (dist/*.whl, dist/*.tar.gz) list it only once
+        listings: Dict[str, List[str]] = {}
+        for s, is_glob, simple in self._artifact_specs:
+            if not is_glob:
                 files.append(s)
+            elif simple is None:
+                files.extend(glob.iglob(s))
+            else:
+                parent, name = simple
+                names = listings.get(parent)
+                if names is None:
+                    try:
+                        names = listings[parent] = os.listdir(parent or os.curdir)
+                    except OSError:
+                        names = listings[parent] = []
+                matches = fnmatch.filter(names, name)
+                if not name.startswith("."):
+                    # Like glob, wildcards do not match hidden files
+                    matches = [m for m in matches if not m.startswith(".")]
+                files.extend(os.path.join(parent, m) for m in matches)
         return files
 
     def run(self) -> Dict[str, Any]:
@@ -51,24 +82,11 @@ class PublishDestinationStep(Step):
             status = "success" if all((r.get("status") == "success") for r in results) else "error"
         except Exception as e:  # noqa: BLE001
             # Destination misconfiguration or unexpected error
-            results = [{"artifact": p, "status": "error", "error": str(e)} for p in (paths or [str(a) for a in self.artifacts])]
+            results = [{"artifact": p, "status": "error", "error": str(e)} for p in (paths or self.artifacts)]
             status = "error"
 
         duration = time.time() - start
         output = {"status": status, "results": results, "duration": duration}
 
-        if self.data:
-            self.data.insert(
-                "steps_output",
-                {
-                    "step_id": self.id,
-                    "runner_id": None,
-                    "name": self.id,
-                    "output_json": output,
-                    "stdout": None,
-                    "stderr": None,
-                    "status": status,
-                    "duration": duration,
-                },
-            )
+        self._record_output(output)
         return output
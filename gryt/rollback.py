@@ -5,22 +5,67 @@ Provides database snapshot and rollback capabilities for safe evolution.
 """
 from __future__ import annotations
 
+import os
+import re
 import shutil
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from .data import SqliteData
 
+try:  # reflink snapshots are Linux-only; elsewhere the backup API is used
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# FICLONE from linux/fs.h: share the source file's extents copy-on-write
+_FICLONE = 0x40049409
+
+_SNAPSHOTS_SCHEMA = {
+    "snapshot_id": "TEXT PRIMARY KEY",
+    "label": "TEXT",
+    "created_at": "DATETIME DEFAULT CURRENT_TIMESTAMP",
+    "db_size_bytes": "INTEGER",
+}
+
+# snapshot_<YYYYmmdd>_<HHMMSS>[_<label>].db, as named by create_snapshot
+_SNAPSHOT_FILE_RE = re.compile(r"(snapshot_(\d{8}_\d{6})(?:_(.*))?)\.db")
+
+# Tables compared by get_snapshot_diff, and the query for which exist on both sides
+_DIFF_TABLES = ("generations", "evolutions", "pipelines")
+_SQL_COMMON_TABLES = (
+    "SELECT name FROM main.sqlite_master WHERE type = 'table' "
+    "INTERSECT SELECT name FROM snap.sqlite_master WHERE type = 'table'"
+)
+
 
 class RollbackManager:
-    """Manages database snapshots and rollback operations"""
+    """Manages database snapshots and rollback operations
+
+    One connection to the database is opened on first use and shared by all
+    operations; call close() when done with the manager.
+    """
 
     def __init__(self, db_path: Path):
         self.db_path = Path(db_path)
         self.snapshot_dir = self.db_path.parent / "snapshots"
         self.snapshot_dir.mkdir(exist_ok=True)
+        self._data: Optional[SqliteData] = None
+
+    def close(self) -> None:
+        """Close the shared database connection (reopened on next use)."""
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+
+    def _db(self) -> SqliteData:
+        if self._data is None:
+            self._data = SqliteData(db_path=str(self.db_path))
+            self._data.create_table("snapshots", _SNAPSHOTS_SCHEMA)
+        return self._data
 
     def create_snapshot(self, label: Optional[str] = None) -> str:
         """Create a database snapshot
@@ -38,61 +83,81 @@ class RollbackManager:
 
         snapshot_path = self.snapshot_dir / f"{snapshot_id}.db"
 
-        # Copy database file
-        shutil.copy2(self.db_path, snapshot_path)
+        # Prefer a reflink (no bytes copied); otherwise copy through SQLite's
+        # online backup API, which stays consistent while others are writing
+        if not self._clone_snapshot(snapshot_path):
+            dst = sqlite3.connect(snapshot_path)
+            try:
+                self._db().conn.backup(dst)
+            finally:
+                dst.close()
 
         # Store metadata
         self._store_snapshot_metadata(snapshot_id, label)
 
         return snapshot_id
 
-    def _store_snapshot_metadata(self, snapshot_id: str, label: Optional[str]) -> None:
-        """Store snapshot metadata in database"""
-        data = SqliteData(db_path=str(self.db_path))
+    def _clone_snapshot(self, snapshot_path: Path) -> bool:
+        """Reflink the database file where the filesystem supports it (Btrfs, XFS, ...).
+
+        Returns False, leaving nothing behind, when cloning is not possible.
+        """
+        if fcntl is None:
+            return False
+        data = self._db()
         try:
-            # Ensure snapshots table exists
-            data.query("""
-                CREATE TABLE IF NOT EXISTS snapshots (
-                    snapshot_id TEXT PRIMARY KEY,
-                    label TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    db_size_bytes INTEGER
-                )
-            """)
+            # Fold the WAL into the main file, then hold the write lock so no
+            # other connection changes it while the extents are shared
+            data.query_one("PRAGMA wal_checkpoint(TRUNCATE)")
+            with data.transaction():
+                with open(self.db_path, "rb") as src, open(snapshot_path, "wb") as dst:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except (OSError, sqlite3.Error):
+            snapshot_path.unlink(missing_ok=True)
+            return False
+        return True
 
-            # Get database size
-            db_size = self.db_path.stat().st_size
+    def _store_snapshot_metadata(self, snapshot_id: str, label: Optional[str]) -> None:
+        """Store snapshot metadata in database"""
+        # Get database size
+        db_size = self.db_path.stat().st_size
 
-            data.insert("snapshots", {
-                "snapshot_id": snapshot_id,
-                "label": label,
-                "created_at": datetime.now().isoformat(),
-                "db_size_bytes": db_size
-            })
-        finally:
-            data.close()
+        self._db().insert("snapshots", {
+            "snapshot_id": snapshot_id,
+            "label": label,
+            "created_at": datetime.now().isoformat(),
+            "db_size_bytes": db_size
+        })
 
     def list_snapshots(self) -> List[Dict[str, Any]]:
         """List all available snapshots"""
-        data = SqliteData(db_path=str(self.db_path))
-        try:
-            # Ensure table exists
-            data.query("""
-                CREATE TABLE IF NOT EXISTS snapshots (
-                    snapshot_id TEXT PRIMARY KEY,
-                    label TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    db_size_bytes INTEGER
-                )
-            """)
+        return self._db().query("""
+            SELECT * FROM snapshots
+            ORDER BY created_at DESC
+        """)
 
-            rows = data.query("""
-                SELECT * FROM snapshots
-                ORDER BY created_at DESC
-            """)
-            return [dict(row) for row in rows]
-        finally:
-            data.close()
+    def list_snapshots_fast(self) -> List[Dict[str, Any]]:
+        """List snapshots from the snapshot directory alone, newest first.
+
+        Reads no database: id, label and creation time (to the second) come
+        from the file name and the size from the file itself. Use
+        list_snapshots() for the recorded metadata.
+        """
+        snapshots = []
+        with os.scandir(self.snapshot_dir) as entries:
+            for entry in entries:
+                match = _SNAPSHOT_FILE_RE.fullmatch(entry.name)
+                if not match or not entry.is_file():
+                    continue
+                snapshot_id, stamp, label = match.groups()
+                snapshots.append({
+                    "snapshot_id": snapshot_id,
+                    "label": label,
+                    "created_at": datetime.strptime(stamp, "%Y%m%d_%H%M%S").isoformat(),
+                    "db_size_bytes": entry.stat().st_size,
+                })
+        snapshots.sort(key=lambda s: s["created_at"], reverse=True)
+        return snapshots
 
     def rollback_to_snapshot(self, snapshot_id: str, backup_current: bool = True) -> None:
         """Rollback database to a previous snapshot
@@ -110,7 +175,9 @@ class RollbackManager:
         if backup_current:
             self.create_snapshot(label="pre_rollback")
 
-        # Perform rollback by replacing database file
+        # Perform rollback by replacing database file; the shared connection
+        # must not outlive the file it was opened on
+        self.close()
         shutil.copy2(snapshot_path, self.db_path)
 
     def delete_snapshot(self, snapshot_id: str) -> None:
@@ -125,20 +192,21 @@ class RollbackManager:
             snapshot_path.unlink()
 
         # Remove from metadata
-        data = SqliteData(db_path=str(self.db_path))
-        try:
-            data.query(
-                "DELETE FROM snapshots WHERE snapshot_id = ?",
-                (snapshot_id,)
-            )
-        finally:
-            data.close()
-
-    def get_snapshot_diff(self, snapshot_id: str) -> Dict[str, Any]:
+        data = self._db()
+        data.execute(
+            "DELETE FROM snapshots WHERE snapshot_id = ?",
+            (snapshot_id,)
+        )
+        data.commit()
+
+    def get_snapshot_diff(self, snapshot_id: str, parallel: bool = False) -> Dict[str, Any]:
         """Get differences between current state and a snapshot
 
         Args:
             snapshot_id: ID of snapshot to compare with
+            parallel: Count each table on its own thread and connections;
+                worthwhile only when the tables are large enough for the
+                counts to dominate
 
         Returns:
             Dictionary with differences
@@ -148,49 +216,65 @@ class RollbackManager:
         if not snapshot_path.exists():
             raise ValueError(f"Snapshot not found: {snapshot_id}")
 
-        # Connect to both databases
-        current_conn = sqlite3.connect(self.db_path)
-        snapshot_conn = sqlite3.connect(snapshot_path)
-
-        diff = {
-            "generations": self._diff_table(current_conn, snapshot_conn, "generations"),
-            "evolutions": self._diff_table(current_conn, snapshot_conn, "evolutions"),
-            "pipelines": self._diff_table(current_conn, snapshot_conn, "pipelines"),
-        }
-
-        current_conn.close()
-        snapshot_conn.close()
-
-        return diff
-
-    def _diff_table(
-        self,
-        current_conn: sqlite3.Connection,
-        snapshot_conn: sqlite3.Connection,
-        table_name: str
-    ) -> Dict[str, int]:
-        """Calculate differences in a table"""
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(_DIFF_TABLES)) as ex:
+                futures = {
+                    t: ex.submit(self._count_pair, self.db_path, snapshot_path, t)
+                    for t in _DIFF_TABLES
+                }
+                counts = {t: f.result() for t, f in futures.items()}
+            return self._build_diff(counts)
+
+        # One connection with the snapshot attached; tables missing from either
+        # side report zero counts
+        conn = sqlite3.connect(self.db_path)
         try:
-            current_count = current_conn.execute(
-                f"SELECT COUNT(*) FROM {table_name}"
-            ).fetchone()[0]
+            conn.execute("ATTACH DATABASE ? AS snap", (str(snapshot_path),))
+            present = {row[0] for row in conn.execute(_SQL_COMMON_TABLES)}
+            tables = [t for t in _DIFF_TABLES if t in present]
+            counts = {}
+            if tables:
+                sql = " UNION ALL ".join(
+                    f"SELECT '{t}', (SELECT COUNT(*) FROM main.{t}), (SELECT COUNT(*) FROM snap.{t})"
+                    for t in tables
+                )
+                counts = {name: (current, snapshot) for name, current, snapshot in conn.execute(sql)}
+        finally:
+            conn.close()
+        return self._build_diff(counts)
 
-            snapshot_count = snapshot_conn.execute(
-                f"SELECT COUNT(*) FROM {table_name}"
-            ).fetchone()[0]
+    @staticmethod
+    def _count_pair(db_path: Path, snapshot_path: Path, table: str) -> tuple:
+        """Row counts of table in the live database and the snapshot
 
-            return {
+        Like the attached query, a table missing from either side counts as
+        zero on both.
+        """
+        pair = []
+        for path in (db_path, snapshot_path):
+            conn = sqlite3.connect(path)
+            try:
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+                ).fetchone()
+                if not exists:
+                    return (0, 0)
+                pair.append(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+            finally:
+                conn.close()
+        return tuple(pair)
+
+    @staticmethod
+    def _build_diff(counts: Dict[str, tuple]) -> Dict[str, Any]:
+        diff = {}
+        for table in _DIFF_TABLES:
+            current_count, snapshot_count = counts.get(table, (0, 0))
+            diff[table] = {
                 "current_count": current_count,
                 "snapshot_count": snapshot_count,
                 "delta": current_count - snapshot_count
             }
-        except sqlite3.OperationalError:
-            # Table doesn't exist in one of the databases
-            return {
-                "current_count": 0,
-                "snapshot_count": 0,
-                "delta": 0
-            }
+        return diff
 
     def cleanup_old_snapshots(self, keep_count: int = 10) -> List[str]:
         """Delete old snapshots, keeping only the most recent
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .data import Data
-from .step import Step
+from .step import STEP_OUTPUT_COLUMNS, Step
 
 
 class Runner:
@@ -11,6 +11,9 @@ class Runner:
 
     Config options:
     - fail_fast: bool (default True) – stop on the first error
+
+    steps_output rows recorded by the steps are buffered and written in one
+    batch per database once the run ends (including on failure).
     """
 
     def __init__(self, steps: List[Step], data: Optional[Data] = None, config: Optional[Dict[str, Any]] = None) -> None:
@@ -19,10 +22,39 @@ class Runner:
         self.config = config or {"fail_fast": True}
 
     def execute(self) -> Dict[str, Dict[str, Any]]:
+        if self.data is not None:
+            for step in self.steps:
+                step.data = step.data or self.data
+        elif not any(step.data for step in self.steps):
+            # Nothing will be recorded: skip buffer setup, teardown and flush
+            return self._execute_steps()
+        buffer: List[Tuple[Data, Tuple[Any, ...]]] = []
+        for step in self.steps:
+            step._output_buffer = buffer
+        try:
+            return self._execute_steps()
+        finally:
+            for step in self.steps:
+                step._output_buffer = None
+            self._flush_outputs(buffer)
+
+    @staticmethod
+    def _flush_outputs(buffer: List[Tuple[Data, Tuple[Any, ...]]]) -> None:
+        by_data: Dict[int, Tuple[Data, List[Tuple[Any, ...]]]] = {}
+        for data, row in buffer:
+            by_data.setdefault(id(data), (data, []))[1].append(row)
+        for data, rows in by_data.values():
+            if hasattr(data, "insert_many"):
+                data.insert_many("steps_output", STEP_OUTPUT_COLUMNS, rows)
+            else:
+                for row in rows:
+                    data.insert("steps_output", dict(zip(STEP_OUTPUT_COLUMNS, row)))
+
+    def _execute_steps(self) -> Dict[str, Dict[str, Any]]:
         results: Dict[str, Dict[str, Any]] = {}
+        fail_fast = self.config.get("fail_fast", True)
         for step in self.steps:
-            step.data = step.data or self.data
-            hook = getattr(step, "hook", None)
+            hook = step.hook
             try:
                 if hook:
                     try:
@@ -39,7 +71,7 @@ class Runner:
                         hook.on_step_end(step, res, context=None)
                     except Exception:
                         pass
-                if res.get("status") == "error" and self.config.get("fail_fast", True):
+                if fail_fast and res.get("status") == "error":
                     break
             except Exception as e:  # noqa: BLE001
                 results[step.id] = {"status": "error", "error": str(e)}
@@ -48,6 +80,6 @@ class Runner:
                         hook.on_error("step", e, context=None)
                     except Exception:
                         pass
-                if self.config.get("fail_fast", True):
+                if fail_fast:
                     break
         return results
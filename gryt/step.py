@@ -3,12 +3,16 @@ from __future__ import annotations
 import subprocess
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .data import Data
 from .hook import Hook
 
 
+# Column order of steps_output rows written through Step._record_output
+STEP_OUTPUT_COLUMNS = ("step_id", "runner_id", "name", "output_json", "stdout", "stderr", "status", "duration")
+
+
 class Step(ABC):
     """A granular unit of work.
 
@@ -16,6 +20,11 @@ class Step(ABC):
     that is JSON-serializable.
     """
 
+    # Set by Pipeline.execute(show=...); CommandStep streams output when True
+    show: bool = False
+    # Set by Runner.execute so steps_output rows are written in one batch
+    _output_buffer: Optional[List[Tuple[Data, Tuple[Any, ...]]]] = None
+
     def __init__(self, id: str, config: Optional[Dict[str, Any]] = None, data: Optional[Data] = None, hook: Optional["Hook"] = None) -> None:
         self.id = id
         self.config = config or {}
@@ -30,6 +39,25 @@ class Step(ABC):
         """Optional pre-run validation hook."""
         return True
 
+    def _record_output(
+        self,
+        output: Dict[str, Any],
+        stdout: Optional[str] = None,
+        stderr: Optional[str] = None,
+    ) -> None:
+        """Write this step's steps_output row, or queue it while a Runner is batching."""
+        if not self.data:
+            return
+        buffer = self._output_buffer
+        # A buffered row is serialized at flush time, so copy the result now:
+        # keys callers add to it afterwards must not reach output_json
+        stored = output if buffer is None else dict(output)
+        row = (self.id, None, self.id, stored, stdout, stderr, output.get("status"), output.get("duration"))
+        if buffer is not None:
+            buffer.append((self.data, row))
+        else:
+            self.data.insert("steps_output", dict(zip(STEP_OUTPUT_COLUMNS, row)))
+
 
 class CommandStep(Step):
     """Run a shell command and capture output.
@@ -50,7 +78,7 @@ class CommandStep(Step):
         timeout = self.config.get("timeout")
         retries = int(self.config.get("retries", 0))
         cwd = self.config.get("cwd")
-        show = bool(getattr(self, "show", False))
+        show = self.show
 
         attempt = 0
         last_error: Optional[str] = None
@@ -124,20 +152,7 @@ class CommandStep(Step):
                         "duration": duration,
                         "attempts": attempt + 1,
                     }
-                    if self.data:
-                        self.data.insert(
-                            "steps_output",
-                            {
-                                "step_id": self.id,
-                                "runner_id": None,
-                                "name": self.id,
-                                "output_json": result,
-                                "stdout": stdout_text,
-                                "stderr": stderr_text,
-                                "status": result.get("status"),
-                                "duration": duration,
-                            },
-                        )
+                    self._record_output(result, stdout_text, stderr_text)
                     return result
                 else:
                     # Non-zero exit; possibly retry
@@ -153,20 +168,7 @@ class CommandStep(Step):
                             "duration": duration,
                             "attempts": attempt,
                         }
-                        if self.data:
-                            self.data.insert(
-                                "steps_output",
-                                {
-                                    "step_id": self.id,
-                                    "runner_id": None,
-                                    "name": self.id,
-                                    "output_json": result,
-                                    "stdout": stdout_text,
-                                    "stderr": stderr_text,
-                                    "status": result.get("status"),
-                                    "duration": duration,
-                                },
-                            )
+                        self._record_output(result, stdout_text, stderr_text)
                         return result
                     # else: continue loop to retry
                     continue
@@ -184,20 +186,7 @@ class CommandStep(Step):
                         "duration": duration,
                         "attempts": attempt,
                     }
-                    if self.data:
-                        self.data.insert(
-                            "steps_output",
-                            {
-                                "step_id": self.id,
-                                "runner_id": None,
-                                "name": self.id,
-                                "output_json": result,
-                                "stdout": "",
-                                "stderr": "",
-                                "status": result.get("status"),
-                                "duration": duration,
-                            },
-                        )
+                    self._record_output(result, "", "")
                     return result
         # Fallback (should not reach here)
         return {"status": "error", "error": last_error or "unknown error"}
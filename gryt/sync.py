@@ -603,6 +603,12 @@ class CloudSync:
 
     def _insert_from_cloud(self, cloud_gen: Dict[str, Any]) -> None:
         """Insert generation from cloud data"""
+        # The cloud payload may not carry is_hotfix; HotfixWorkflow always
+        # describes its generations as "Hot-fix for <base>: <title>"
+        is_hotfix = cloud_gen.get("is_hotfix")
+        if is_hotfix is None:
+            is_hotfix = (cloud_gen.get("description") or "").startswith("Hot-fix for ")
+
         # Insert generation
         self.data.insert("generations", {
             "generation_id": cloud_gen["generation_id"],
@@ -615,6 +621,7 @@ class CloudSync:
             "created_by": cloud_gen.get("created_by"),
             "promoted_by": cloud_gen.get("promoted_by"),
             "team_id": cloud_gen.get("team_id"),
+            "is_hotfix": int(bool(is_hotfix)),
             "sync_status": "synced",
             "remote_id": cloud_gen["id"],
             "last_synced_at": datetime.now()
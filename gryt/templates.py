@@ -8,6 +8,7 @@ from __future__ import annotations
 import json
 import shutil
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
@@ -475,10 +476,7 @@ gryt generation new v0.1.0
     )
 
 
-# Global registry instance
-_registry = TemplateRegistry()
-
-
+@lru_cache(maxsize=None)
 def get_template_registry() -> TemplateRegistry:
-    """Get the global template registry"""
-    return _registry
+    """Get the global template registry (built on first use)"""
+    return TemplateRegistry()
@@ -46,7 +46,7 @@ class ScytheValidator(Step):
             data=self.data,
         )
         try:
-            setattr(_cs, "show", bool(getattr(self, "show", False)))
+            _cs.show = self.show
         except Exception:
             pass
         return _cs.run()
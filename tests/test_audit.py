@@ -52,6 +52,28 @@ class TestAuditTrail:
         assert events[0]["action"] == "created"
         assert events[0]["actor"] == "test-user"
 
+    def test_log_event_async_batches_and_flushes(self, test_db_path):
+        """Test queued events are written on flush and before close"""
+        from gryt.data import SqliteData
+
+        data = SqliteData(db_path=str(test_db_path))
+        audit = AuditTrail(data)
+        first = audit.log_event_async("generation", "generation", "gen-1", "created")
+        audit.flush()
+        assert len(data.query("SELECT * FROM audit_events WHERE event_id = ?", (first,))) == 1
+
+        ids = [
+            audit.log_event_async("evolution", "evolution", f"evo-{i}", "completed", details={"n": i})
+            for i in range(10)
+        ]
+        data.close()
+
+        data = SqliteData(db_path=str(test_db_path))
+        rows = data.query("SELECT event_id, details_json FROM audit_events WHERE event_type = 'evolution'")
+        data.close()
+        assert {r["event_id"] for r in rows} == set(ids)
+        assert sorted(r["details_json"]["n"] for r in rows) == list(range(10))
+
     def test_export_json(self, test_db, temp_dir):
         """Test JSON export"""
         audit = AuditTrail(test_db)
@@ -139,6 +161,46 @@ class TestRollbackManager:
         assert id1 in snapshot_ids
         assert id2 in snapshot_ids
 
+    def test_list_snapshots_fast(self, test_db_path):
+        """Test listing snapshots from the snapshot directory"""
+        manager = RollbackManager(test_db_path)
+        snapshot_id = manager.create_snapshot(label="quick_look")
+        manager.close()
+        (manager.snapshot_dir / "notes.txt").write_text("not a snapshot")
+
+        snapshots = manager.list_snapshots_fast()
+
+        assert [s["snapshot_id"] for s in snapshots] == [snapshot_id]
+        assert snapshots[0]["label"] == "quick_look"
+        assert snapshots[0]["db_size_bytes"] > 0
+
+    def test_delete_snapshot(self, test_db_path):
+        """Test deleting a snapshot removes its file and metadata"""
+        manager = RollbackManager(test_db_path)
+        snapshot_id = manager.create_snapshot(label="doomed")
+
+        manager.delete_snapshot(snapshot_id)
+        manager.close()
+
+        assert not (manager.snapshot_dir / f"{snapshot_id}.db").exists()
+        assert snapshot_id not in [s["snapshot_id"] for s in manager.list_snapshots()]
+        manager.close()
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_get_snapshot_diff(self, test_db, test_db_path, parallel):
+        """Test row-count diff between the live database and a snapshot"""
+        manager = RollbackManager(test_db_path)
+        test_db.insert("generations", {"generation_id": "gen-1", "version": "v1.0.0"})
+        snapshot_id = manager.create_snapshot(label="diff")
+        test_db.insert("generations", {"generation_id": "gen-2", "version": "v2.0.0"})
+
+        diff = manager.get_snapshot_diff(snapshot_id, parallel=parallel)
+        manager.close()
+
+        assert diff["generations"] == {"current_count": 2, "snapshot_count": 1, "delta": 1}
+        assert diff["evolutions"]["delta"] == 0
+        assert set(diff) == {"generations", "evolutions", "pipelines"}
+
     def test_rollback_to_snapshot(self, test_db, test_db_path):
         """Test rollback to previous state"""
         manager = RollbackManager(test_db_path)
@@ -229,6 +291,30 @@ class TestHotfixWorkflow:
         assert result.passed is False
         assert "pending" in result.message.lower()
 
+    def test_hotfix_gate_reports_first_change_without_evolutions(self, test_db):
+        """Test HotfixGate checks every change against the batched counts"""
+        gen = Generation(
+            version="v1.0.3",
+            description="Hot-fix",
+            changes=[
+                GenerationChange(change_id="HOTFIX-003", change_type="fix", title="Fixed"),
+                GenerationChange(change_id="HOTFIX-004", change_type="fix", title="Untested"),
+            ],
+        )
+        gen.save_to_db(test_db)
+        Evolution(
+            tag="v1.0.3-rc.1",
+            generation_id=gen.generation_id,
+            change_id="HOTFIX-003",
+            status="pass",
+        ).save_to_db(test_db)
+
+        result = HotfixGate().check(gen, test_db)
+
+        assert result.passed is False
+        assert result.details == {"change_id": "HOTFIX-004"}
+        assert "no evolutions" in result.message
+
     def test_calculate_hotfix_version(self, test_db):
         """Test hot-fix version calculation"""
         workflow = HotfixWorkflow(test_db)
@@ -258,6 +344,51 @@ class TestHotfixWorkflow:
 
         assert hotfix_version == "v1.2.2"
 
+    def test_calculate_hotfix_version_rejects_malformed_versions(self, test_db):
+        """Test non-numeric or incomplete versions are rejected"""
+        workflow = HotfixWorkflow(test_db)
+
+        for version in ("v1.2", "v1.x.0"):
+            with pytest.raises(ValueError, match="Invalid version format"):
+                workflow._calculate_hotfix_version(version)
+
+    def test_calculate_hotfix_version_compares_patches_numerically(self, test_db):
+        """Test v1.2.10 is treated as newer than v1.2.9"""
+        workflow = HotfixWorkflow(test_db)
+        for version in ("v1.2.0", "v1.2.9", "v1.2.10"):
+            Generation(version=version, description="Release", changes=[]).save_to_db(test_db)
+
+        assert workflow._calculate_hotfix_version("v1.2.0") == "v1.2.11"
+
+    def test_list_hotfixes_returns_only_flagged_generations(self, test_db):
+        """Test list_hotfixes uses the is_hotfix flag rather than version shape"""
+        workflow = HotfixWorkflow(test_db)
+        Generation(version="v1.3.0", description="Base", changes=[]).save_to_db(test_db)
+
+        hotfix = workflow.create_hotfix_generation("v1.3.0", "BUG-130", "Fix crash")
+        hotfixes = workflow.list_hotfixes()
+
+        assert [g.version for g in hotfixes] == [hotfix.version]
+        assert hotfixes[0].is_hotfix is True
+        assert [c.change_id for c in hotfixes[0].changes] == ["BUG-130"]
+
+    def test_hotfix_statistics(self, test_db):
+        """Test hot-fix statistics are counted per status"""
+        workflow = HotfixWorkflow(test_db)
+        assert workflow.get_hotfix_statistics()["total_hotfixes"] == 0
+
+        Generation(version="v1.4.0", description="Base", changes=[]).save_to_db(test_db)
+        first = workflow.create_hotfix_generation("v1.4.0", "BUG-140", "First")
+        workflow.create_hotfix_generation("v1.4.0", "BUG-141", "Second")
+        first.status = "promoted"
+        first.save_to_db(test_db, emit_event=False)
+
+        stats = workflow.get_hotfix_statistics()
+
+        assert stats["total_hotfixes"] == 2
+        assert stats["promoted_hotfixes"] == 1
+        assert stats["pending_hotfixes"] == 1
+
     def test_create_hotfix_helper(self, test_db_path):
         """Test create_hotfix helper function"""
         generation = create_hotfix(
@@ -38,6 +38,18 @@ class TestRepoRootFinder:
         # Should not find root since .git is missing
         assert root is None
 
+    def test_find_repo_root_cache_revalidates(self, gryt_project):
+        """Test cached roots are reused but dropped once the repo is gone"""
+        import shutil
+        from gryt import paths
+
+        assert find_repo_root(gryt_project) == gryt_project
+        assert paths._REPO_ROOT_CACHE[str(gryt_project.resolve())] == str(gryt_project)
+
+        shutil.rmtree(gryt_project / ".gryt")
+        assert find_repo_root(gryt_project) is None
+        assert str(gryt_project.resolve()) not in paths._REPO_ROOT_CACHE
+
     def test_get_repo_gryt_dir(self, gryt_project):
         """Test getting .gryt directory path"""
         gryt_dir = get_repo_gryt_dir(gryt_project)
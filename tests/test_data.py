@@ -24,6 +24,18 @@ class TestSqliteData:
         assert "generation_changes" in table_names
         assert "evolutions" in table_names
 
+    def test_initialize_schema_at(self, temp_dir):
+        """Test initialize_schema_at creates the schema with foreign keys enforced"""
+        db_path = temp_dir / "fresh.db"
+        SqliteData.initialize_schema_at(db_path)
+
+        data = SqliteData(db_path=db_path)
+        try:
+            assert data.query_one("SELECT 1 FROM sqlite_master WHERE name = 'auth_output'") is not None
+            assert data.query_one("PRAGMA foreign_keys")[0] == 1
+        finally:
+            data.close()
+
     def test_insert_and_query(self, test_db):
         """Test basic insert and query operations"""
         test_db.insert("pipelines", {
@@ -139,3 +151,89 @@ class TestSqliteData:
         )
 
         assert rows[0]["count"] == 10
+
+    def test_transaction_commits_batch(self, test_db):
+        """Test writes inside a transaction are committed together"""
+        with test_db.transaction():
+            test_db.insert("pipelines", {"pipeline_id": "tx-1", "name": "One"})
+            test_db.executemany(
+                "INSERT INTO pipelines (pipeline_id, name) VALUES (?, ?)",
+                [("tx-2", "Two"), ("tx-3", "Three")]
+            )
+
+        rows = test_db.query(
+            "SELECT COUNT(*) as count FROM pipelines WHERE pipeline_id LIKE 'tx-%'"
+        )
+        assert rows[0]["count"] == 3
+
+    def test_transaction_rolls_back_on_error(self, test_db):
+        """Test a failing transaction leaves no partial writes"""
+        with pytest.raises(RuntimeError):
+            with test_db.transaction():
+                test_db.insert("pipelines", {"pipeline_id": "rb-1", "name": "One"})
+                raise RuntimeError("boom")
+
+        rows = test_db.query(
+            "SELECT COUNT(*) as count FROM pipelines WHERE pipeline_id = 'rb-1'"
+        )
+        assert rows[0]["count"] == 0
+
+    def test_failed_migration_rolls_back_schema_transaction(self, test_db, monkeypatch):
+        """Test a migration error leaves no open transaction or partial DDL"""
+        def failing_migration():
+            test_db.conn.execute("CREATE TABLE half_done (id INTEGER)")
+            raise RuntimeError("migration failed")
+
+        monkeypatch.setattr(test_db, "_create_tables", failing_migration)
+        with pytest.raises(RuntimeError):
+            test_db._init_tables()
+
+        assert not test_db.conn.in_transaction
+        assert test_db.query_one("SELECT 1 FROM sqlite_master WHERE name = 'half_done'") is None
+
+    def test_apply_performance_pragmas(self, test_db):
+        """Test WAL and relaxed sync are enabled on a file database"""
+        test_db.apply_performance_pragmas()
+
+        assert test_db.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert test_db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert test_db.conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        assert test_db.conn.execute("PRAGMA cache_size").fetchone()[0] == -16000
+
+    def test_query_rows_returns_raw_rows(self, test_db):
+        """Test query_rows supports name and positional access without JSON parsing"""
+        test_db.insert("pipelines", {
+            "pipeline_id": "raw-1",
+            "name": "Raw",
+            "config_json": {"key": "value"}
+        })
+
+        rows = test_db.query_rows(
+            "SELECT pipeline_id, name, config_json FROM pipelines WHERE pipeline_id = ?",
+            ("raw-1",)
+        )
+        pipeline_id, name, config_json = rows[0]
+
+        assert rows[0]["name"] == "Raw"
+        assert (pipeline_id, name) == ("raw-1", "Raw")
+        assert config_json == '{"key":"value"}'
+
+    def test_insert_many(self, test_db):
+        """Test batched inserts serialize JSON values and honour or_ignore"""
+        test_db.insert_many(
+            "pipelines",
+            ("pipeline_id", "name", "config_json"),
+            [("many-1", "One", {"a": 1}), ("many-2", "Two", None)]
+        )
+        test_db.insert_many(
+            "pipelines",
+            ("pipeline_id", "name"),
+            [("many-1", "Duplicate"), ("many-3", "Three")],
+            or_ignore=True
+        )
+
+        rows = test_db.query(
+            "SELECT pipeline_id, name, config_json FROM pipelines WHERE pipeline_id LIKE 'many-%' ORDER BY pipeline_id"
+        )
+        assert [r["name"] for r in rows] == ["One", "Two", "Three"]
+        assert rows[0]["config_json"] == {"a": 1}
@@ -0,0 +1,68 @@
+"""Tests for the lifecycle EventBus"""
+import threading
+
+from gryt.events import EventBus
+
+
+class TestEventBus:
+    """Test EventBus delivery"""
+
+    def test_emit_calls_handlers_synchronously(self):
+        """Test emit delivers to subscribed handlers on the caller's thread"""
+        bus = EventBus()
+        received = []
+        bus.subscribe("generation.created", lambda e: received.append((e.name, threading.current_thread())))
+
+        bus.emit("generation.created", {"generation": {}})
+
+        assert received == [("generation.created", threading.current_thread())]
+
+    def test_emit_async_delivers_in_order_after_flush(self):
+        """Test emit_async delivers on a worker thread, preserving order"""
+        bus = EventBus()
+        received = []
+        threads = set()
+
+        def handler(event):
+            received.append(event.payload["n"])
+            threads.add(threading.current_thread())
+
+        bus.subscribe("generation.updated", handler)
+
+        for n in range(5):
+            bus.emit_async("generation.updated", {"n": n})
+        bus.flush()
+
+        assert received == [0, 1, 2, 3, 4]
+        assert threading.current_thread() not in threads
+
+    def test_emit_async_survives_handler_errors(self):
+        """Test a failing handler does not stop later queued events"""
+        bus = EventBus()
+        received = []
+
+        def handler(event):
+            if event.payload["n"] == 0:
+                raise RuntimeError("boom")
+            received.append(event.payload["n"])
+
+        bus.subscribe("evolution.completed", handler)
+        bus.emit_async("evolution.completed", {"n": 0})
+        bus.emit_async("evolution.completed", {"n": 1})
+        bus.flush()
+
+        assert received == [1]
+
+    def test_restarted_worker_registers_exit_flush_once(self, monkeypatch):
+        """Test recreating the worker does not register flush at exit again"""
+        registered = []
+        monkeypatch.setattr("gryt.events.atexit.register", registered.append)
+        bus = EventBus()
+
+        bus.emit_async("evolution.completed", {"n": 0})
+        bus.flush()
+        bus._worker = None  # as if the worker had died
+        bus.emit_async("evolution.completed", {"n": 1})
+        bus.flush()
+
+        assert registered == [bus.flush]
@@ -1,8 +1,10 @@
 """Tests for Generation and Evolution (v0.2.0, v0.3.0)"""
+import os
 import pytest
 from datetime import datetime
 from gryt.generation import Generation, GenerationChange
 from gryt.evolution import Evolution
+from gryt.data import SqliteData
 
 
 class TestGeneration:
@@ -82,6 +84,17 @@ class TestGeneration:
         assert gen.status == "promoted"
         assert gen.promoted_at is not None
 
+    def test_to_dict_timestamps_follow_updates(self):
+        """Test to_dict reports timestamps assigned after construction"""
+        created = datetime(2025, 1, 2, 3, 4, 5)
+        gen = Generation(version="v3.1.0", changes=[], created_at=created)
+
+        assert gen.to_dict()["created_at"] == "2025-01-02T03:04:05"
+        assert gen.to_dict()["promoted_at"] is None
+
+        gen.promoted_at = datetime(2025, 2, 1)
+        assert gen.to_dict()["promoted_at"] == "2025-02-01T00:00:00"
+
     def test_promote_with_unproven_changes(self, test_db):
         """Test promoting fails with unproven changes"""
         from gryt.gates import AllChangesProvenGate
@@ -98,6 +111,132 @@ class TestGeneration:
         assert result["success"] is False
         assert gen.status == "draft"
 
+    def test_yaml_round_trip(self, temp_dir):
+        """Test saving a generation to YAML and loading it back"""
+        gen = Generation(
+            version="v4.0.1",
+            description="Patch release",
+            changes=[GenerationChange("FIX-401", "fix", "Fix login", description="Null check")]
+        )
+
+        yaml_path = gen.save_to_yaml(temp_dir)
+        loaded = Generation.from_yaml_file(yaml_path)
+
+        assert yaml_path.name == "v4.0.1.yaml"
+        assert loaded.version == "v4.0.1"
+        assert loaded.description == "Patch release"
+        assert [c.to_dict() for c in loaded.changes] == [c.to_dict() for c in gen.changes]
+
+    def test_from_yaml_file_reuses_parse_until_file_changes(self, temp_dir, mocker):
+        """Test an unchanged YAML file is parsed once and re-read after edits"""
+        from gryt import generation as generation_module
+
+        yaml_path = temp_dir / "v4.0.2.yaml"
+        yaml_path.write_text(
+            "version: v4.0.2\nchanges:\n  - {id: FIX-1, type: fix, title: One}\n"
+        )
+        validate = mocker.spy(Generation, "_validate_schema")
+
+        first = Generation.from_yaml_file(yaml_path)
+        first.changes[0].title = "mutated"
+        second = Generation.from_yaml_file(yaml_path)
+
+        assert validate.call_count == 1
+        assert second.changes[0].title == "One"
+        assert second is not first
+
+        yaml_path.write_text(
+            "version: v4.0.2\nchanges:\n  - {id: FIX-1, type: fix, title: Edited}\n"
+        )
+        os.utime(yaml_path, ns=(0, 1))
+        assert Generation.from_yaml_file(yaml_path).changes[0].title == "Edited"
+        assert validate.call_count == 2
+        generation_module._YAML_CACHE.clear()
+
+    def test_validate_schema_fast_path_skips_jsonschema(self, mocker):
+        """Test well-formed YAML data is accepted without running jsonschema"""
+        jsonschema = pytest.importorskip("jsonschema")
+        validate = mocker.patch.object(jsonschema, "validate")
+
+        Generation._validate_schema({
+            "version": "v1.2.3",
+            "description": "Release",
+            "changes": [{"id": "FEAT-1", "type": "add", "title": "Feature"}],
+        })
+
+        validate.assert_not_called()
+
+    def test_validate_schema_rejects_invalid_change(self):
+        """Test data failing the fast check still gets full schema errors"""
+        jsonschema = pytest.importorskip("jsonschema")
+
+        with pytest.raises(jsonschema.ValidationError):
+            Generation._validate_schema({
+                "version": "v1.2.3",
+                "changes": [{"id": "FEAT-1", "type": "bug", "title": "Feature"}],
+            })
+
+    def test_from_db_by_version(self, test_db):
+        """Test loading a generation, changes and linked pipelines by version"""
+        gen = Generation(
+            version="v4.3.0",
+            changes=[GenerationChange("FEAT-043", "add", "Linked")]
+        )
+        gen.save_to_db(test_db)
+        test_db.insert("change_pipelines", {
+            "change_id": "FEAT-043",
+            "generation_id": gen.generation_id,
+            "pipeline_name": "v4_3_0_FEAT_043_VALIDATION_PIPELINE.py",
+            "is_primary": 1,
+        })
+
+        loaded = Generation.from_db_by_version(test_db, "4.3.0")
+
+        assert loaded.generation_id == gen.generation_id
+        assert loaded.changes[0].pipelines == [{
+            "pipeline_name": "v4_3_0_FEAT_043_VALIDATION_PIPELINE.py",
+            "is_primary": True,
+            "created_by": None,
+        }]
+        assert Generation.from_db_by_version(test_db, "v9.9.9") is None
+
+    def test_list_summaries_counts_changes(self, test_db):
+        """Test summary listing reports change counts without loading changes"""
+        Generation(
+            version="v4.4.0",
+            changes=[
+                GenerationChange("FEAT-044", "add", "One"),
+                GenerationChange("FEAT-045", "add", "Two"),
+            ]
+        ).save_to_db(test_db)
+        Generation(version="v4.5.0", description='{"raw": true}', changes=[]).save_to_db(test_db)
+
+        summaries = {s["version"]: s for s in Generation.list_summaries(test_db)}
+
+        assert summaries["v4.4.0"]["change_count"] == 2
+        assert summaries["v4.5.0"]["change_count"] == 0
+        assert summaries["v4.4.0"]["status"] == "draft"
+        assert summaries["v4.5.0"]["description"] == '{"raw": true}'
+
+    def test_list_all_loads_changes(self, test_db):
+        """Test listing generations with their changes in one pass"""
+        gen1 = Generation(
+            version="v4.1.0",
+            changes=[
+                GenerationChange("FEAT-041", "add", "First"),
+                GenerationChange("FEAT-042", "fix", "Second"),
+            ]
+        )
+        gen1.save_to_db(test_db)
+        gen2 = Generation(version="v4.2.0", changes=[])
+        gen2.save_to_db(test_db)
+
+        generations = {g.version: g for g in Generation.list_all(test_db)}
+
+        assert set(generations) == {"v4.1.0", "v4.2.0"}
+        assert [c.change_id for c in generations["v4.1.0"].changes] == ["FEAT-041", "FEAT-042"]
+        assert generations["v4.2.0"].changes == []
+
 
 class TestEvolution:
     """Test Evolution functionality"""
@@ -204,3 +343,137 @@ class TestEvolution:
         loaded = Evolution.from_db(test_db, evo.evolution_id)
         assert loaded.status == "pass"
         assert loaded.completed_at is not None
+
+
+class TestGenerationCli:
+    """Test generation CLI commands"""
+
+    def test_commands_share_and_close_connection(self, gryt_project, monkeypatch):
+        """Test a CLI invocation reuses one connection and closes it afterwards"""
+        from typer.testing import CliRunner
+        from gryt import generation_cli
+        from gryt.cli import app
+
+        monkeypatch.chdir(gryt_project)
+        opened = []
+        original_get_db = generation_cli._get_db
+
+        def tracking_get_db():
+            data = original_get_db()
+            opened.append(data)
+            return data
+
+        monkeypatch.setattr(generation_cli, "_get_db", tracking_get_db)
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["generation", "new", "v1.0.0"])
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["generation", "show", "v1.0.0"])
+        assert result.exit_code == 0
+        assert "v1.0.0" in result.output
+
+        assert len(opened) == 2
+        assert generation_cli._shared_db is None
+        assert all(data._conn is None for data in opened)
+
+    def test_update_syncs_changes_from_yaml(self, gryt_project, monkeypatch):
+        """Test update inserts, updates and deletes changes to match the YAML"""
+        from typer.testing import CliRunner
+        from gryt.cli import app
+
+        monkeypatch.chdir(gryt_project)
+        runner = CliRunner()
+        assert runner.invoke(app, ["generation", "new", "v1.0.0"]).exit_code == 0
+
+        yaml_path = gryt_project / ".gryt" / "generations" / "v1.0.0.yaml"
+        yaml_path.write_text(
+            "version: v1.0.0\n"
+            "description: First\n"
+            "changes:\n"
+            "  - {id: FEAT-1, type: add, title: One}\n"
+            "  - {id: FEAT-2, type: fix, title: Two}\n"
+        )
+        result = runner.invoke(app, ["generation", "update", "v1.0.0"])
+        assert result.exit_code == 0, result.output
+
+        yaml_path.write_text(
+            "version: v1.0.0\n"
+            "description: Second\n"
+            "changes:\n"
+            "  - {id: FEAT-2, type: fix, title: Two renamed}\n"
+        )
+        result = runner.invoke(app, ["generation", "update", "v1.0.0"])
+        assert result.exit_code == 0, result.output
+
+        data = SqliteData(db_path=str(gryt_project / ".gryt" / "gryt.db"))
+        rows = data.query("SELECT change_id, title FROM generation_changes")
+        description = data.query("SELECT description FROM generations")[0]["description"]
+        data.close()
+
+        assert rows == [{"change_id": "FEAT-2", "title": "Two renamed"}]
+        assert description == "Second"
+
+    def test_update_skips_unchanged_yaml(self, gryt_project, monkeypatch):
+        """Test a second update of an untouched YAML file is a no-op"""
+        from typer.testing import CliRunner
+        from gryt.cli import app
+
+        monkeypatch.chdir(gryt_project)
+        runner = CliRunner()
+        assert runner.invoke(app, ["generation", "new", "v1.0.0"]).exit_code == 0
+        yaml_path = gryt_project / ".gryt" / "generations" / "v1.0.0.yaml"
+        yaml_path.write_text(
+            "version: v1.0.0\n"
+            "changes:\n"
+            "  - {id: FEAT-1, type: add, title: One}\n"
+        )
+
+        result = runner.invoke(app, ["generation", "update", "v1.0.0"])
+        assert "Updated generation" in result.output, result.output
+        result = runner.invoke(app, ["generation", "update", "v1.0.0"])
+        assert result.exit_code == 0
+        assert "already in sync" in result.output
+
+        os.utime(yaml_path, ns=(yaml_path.stat().st_atime_ns, yaml_path.stat().st_mtime_ns + 1_000_000))
+        result = runner.invoke(app, ["generation", "update", "v1.0.0"])
+        assert "Updated generation" in result.output
+
+    def test_gen_test_links_pipelines(self, gryt_project, monkeypatch):
+        """Test gen-test writes pipeline files and links them once"""
+        from typer.testing import CliRunner
+        from gryt.cli import app
+
+        monkeypatch.chdir(gryt_project)
+        runner = CliRunner()
+        assert runner.invoke(app, ["generation", "new", "v1.0.0"]).exit_code == 0
+        for _ in range(2):
+            result = runner.invoke(app, ["generation", "gen-test", "v1.0.0", "--all", "--force"])
+            assert result.exit_code == 0, result.output
+
+        data = SqliteData(db_path=str(gryt_project / ".gryt" / "gryt.db"))
+        gen = Generation.from_db_by_version(data, "v1.0.0")
+        data.close()
+
+        change = gen.changes[0]
+        assert (gryt_project / ".gryt" / "pipelines" / change.pipeline).exists()
+        assert [p["pipeline_name"] for p in change.pipelines] == [change.pipeline]
+
+    def test_gen_test_writes_all_pipeline_files(self, gryt_project, monkeypatch):
+        """Test gen-test --all writes one pipeline file per change"""
+        from typer.testing import CliRunner
+        from gryt.cli import app
+
+        monkeypatch.chdir(gryt_project)
+        data = SqliteData(db_path=str(gryt_project / ".gryt" / "gryt.db"))
+        Generation(
+            version="v2.0.0",
+            changes=[GenerationChange(f"FEAT-{n}", "add", f"Feature {n}") for n in range(3)]
+        ).save_to_db(data, emit_event=False)
+        data.close()
+
+        result = CliRunner().invoke(app, ["generation", "gen-test", "v2.0.0", "--all"])
+        assert result.exit_code == 0, result.output
+
+        written = sorted(p.name for p in (gryt_project / ".gryt" / "pipelines").iterdir())
+        assert written == [f"v2_0_0_FEAT_{n}_VALIDATION_PIPELINE.py" for n in range(3)]
+        assert "FEAT-0" in (gryt_project / ".gryt" / "pipelines" / written[0]).read_text()
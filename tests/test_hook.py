@@ -0,0 +1,160 @@
+"""Tests for pipeline hooks"""
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from gryt.hook import HttpHook, PrintHook
+from gryt.pipeline import Pipeline
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length))
+        self.server.received.append((self.path, body, self.client_address[1]))
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = HTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    server.received = []
+    server.status = 204
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpHook:
+    """Test HttpHook delivery"""
+
+    def test_posts_events_over_one_connection(self, http_server):
+        """Test consecutive events reuse the same keep-alive connection"""
+        hook = HttpHook(f"http://127.0.0.1:{http_server.server_port}/hooks")
+
+        hook.on_pipeline_start(object())
+        hook.on_step_start(type("Step", (), {"id": "build"})())
+        hook.on_pipeline_end(object(), {"build": {"status": "ok"}})
+
+        paths = [path for path, _, _ in http_server.received]
+        assert paths == ["/hooks/pipeline_start", "/hooks/step_start", "/hooks/pipeline_end"]
+        assert http_server.received[1][1] == {"event": "step_start", "payload": {"id": "build"}}
+        assert len({port for _, _, port in http_server.received}) == 1
+        assert hook._connections == {}
+
+    def test_unreachable_server_is_swallowed(self):
+        """Test delivery errors never propagate into the pipeline"""
+        hook = HttpHook("http://127.0.0.1:9", timeout=0.5)
+
+        hook.on_step_start(object())
+        hook.on_pipeline_end(object(), {})
+
+        assert hook._connections == {}
+
+    def test_retries_then_disables_after_repeated_failures(self, http_server):
+        """Test 503s are retried and the hook stops posting after too many failures"""
+        http_server.status = 503
+        hook = HttpHook(f"http://127.0.0.1:{http_server.server_port}")
+        hook._BACKOFF = 0
+
+        for _ in range(HttpHook._MAX_CONSECUTIVE_FAILURES + 2):
+            hook.on_step_start(object())
+        hook.on_pipeline_end(object(), {})
+
+        attempts = HttpHook._RETRIES + 1
+        assert len(http_server.received) == HttpHook._MAX_CONSECUTIVE_FAILURES * attempts
+        assert hook._disabled
+
+        http_server.status = 204
+        hook.on_pipeline_start(object())
+        hook.on_pipeline_end(object(), {})
+        assert not hook._disabled
+        assert [path for path, _, _ in http_server.received[-2:]] == ["/pipeline_start", "/pipeline_end"]
+
+    def test_events_are_posted_off_the_caller_thread(self, http_server):
+        """Test events are queued and delivered by a background worker"""
+        hook = HttpHook(f"http://127.0.0.1:{http_server.server_port}")
+
+        hook.on_step_end(type("Step", (), {"id": "test"})(), {"status": "ok"})
+        worker = hook._worker
+        hook.on_pipeline_end(object(), {})
+
+        assert worker is not None and worker is not threading.current_thread()
+        assert not worker.is_alive()
+        assert [path for path, _, _ in http_server.received] == ["/step_end", "/pipeline_end"]
+
+    def test_failed_pipeline_delivers_queued_events(self, http_server):
+        """Test a pipeline that raises still delivers its start and error events"""
+        class _ExplodingRunner:
+            steps = []
+
+            def execute(self):
+                raise RuntimeError("runner exploded")
+
+        hook = HttpHook(f"http://127.0.0.1:{http_server.server_port}")
+        pipeline = Pipeline([_ExplodingRunner()], hook=hook)
+
+        with pytest.raises(RuntimeError):
+            pipeline.execute()
+
+        assert hook._worker is None
+        assert [path for path, _, _ in http_server.received] == ["/pipeline_start", "/error"]
+        assert http_server.received[1][1]["payload"] == {"scope": "pipeline", "error": "runner exploded"}
+
+    def test_pending_events_are_drained_at_exit(self, http_server, monkeypatch):
+        """Test the worker registers a bounded drain for interpreter exit"""
+        registered = []
+        monkeypatch.setattr("gryt.hook.atexit.register", registered.append)
+        hook = HttpHook(f"http://127.0.0.1:{http_server.server_port}")
+
+        hook.on_pipeline_start(object())
+        hook.on_step_start(type("Step", (), {"id": "build"})())
+        assert registered == [hook._stop_worker]
+        registered[0]()
+
+        assert [path for path, _, _ in http_server.received] == ["/pipeline_start", "/step_start"]
+
+
+class TestPrintHook:
+    """Test PrintHook output"""
+
+    def test_pipeline_end_summary_is_bounded(self):
+        """Test large results are summarized within the 500 char limit"""
+        stream = io.StringIO()
+        results = {f"step{i}": {"status": "ok", "stdout": "x" * 10_000} for i in range(1000)}
+
+        PrintHook(stream).on_pipeline_end(object(), results)
+
+        line = stream.getvalue().rstrip("\n")
+        assert line.startswith("[hook] pipeline_end: results={")
+        assert line.endswith("...")
+        assert len(line) <= len("[hook] pipeline_end: results=") + 500
+
+    def test_on_error_formats_the_error_itself(self, capsys):
+        """Test on_error prints the given error's traceback, not the ambient one"""
+        try:
+            raise ValueError("step exploded")
+        except ValueError as e:
+            caught = e
+
+        PrintHook().on_error("runner", caught)
+        PrintHook().on_error("pipeline", RuntimeError("no traceback"))
+
+        err = capsys.readouterr().err
+        assert "[hook] error in runner: step exploded" in err
+        assert "Traceback (most recent call last):" in err
+        assert "ValueError: step exploded" in err
+        assert "RuntimeError: no traceback" in err
+        assert "NoneType: None" not in err
@@ -0,0 +1,97 @@
+"""Tests for gryt.pipeline module"""
+import concurrent.futures
+import time
+
+import pytest
+
+from gryt.pipeline import Pipeline
+from gryt.runner import Runner
+from gryt.step import CommandStep
+
+
+def _runners(n, data=None):
+    return [Runner([CommandStep(f"echo{i}", {"cmd": ["echo", str(i)]})], data=data) for i in range(n)]
+
+
+class TestParallelKind:
+    """Test the executor used for parallel runners"""
+
+    def test_unknown_kind_is_rejected(self):
+        """Test an unsupported parallel_kind fails at construction"""
+        with pytest.raises(ValueError, match="Unsupported parallel_kind"):
+            Pipeline([], parallel_kind="fiber")
+
+    def test_process_kind_runs_picklable_runners_in_processes(self):
+        """Test runners without a data store run on a process pool"""
+        pipeline = Pipeline(_runners(2), parallel_kind="process")
+        try:
+            results = pipeline.execute(parallel=True)
+            assert isinstance(pipeline._runner_executor, concurrent.futures.ProcessPoolExecutor)
+        finally:
+            pipeline.close()
+
+        assert results["runner_0"]["echo0"]["stdout"] == "0"
+        assert results["runner_1"]["echo1"]["status"] == "success"
+
+    def test_process_kind_with_data_falls_back_to_threads(self, test_db):
+        """Test runners holding an SQLite store run on threads and keep their writes"""
+        pipeline = Pipeline(_runners(2), data=test_db, parallel_kind="process")
+        try:
+            results = pipeline.execute(parallel=True)
+            assert pipeline._runner_executor is None
+            assert not pipeline._runners_picklable
+        finally:
+            pipeline.close()
+
+        assert results["runner_0"]["echo0"]["status"] == "success"
+        rows = test_db.query("SELECT step_id FROM steps_output ORDER BY step_id")
+        assert [r["step_id"] for r in rows] == ["echo0", "echo1"]
+
+    def test_interpreter_kind_runs_runners(self, test_db):
+        """Test the interpreter kind runs runners (threads where sub-interpreters are unavailable)"""
+        pipeline = Pipeline(_runners(2), data=test_db, parallel_kind="interpreter")
+        try:
+            results = pipeline.execute(parallel=True)
+        finally:
+            pipeline.close()
+
+        assert [results[k]["echo" + k[-1]]["status"] for k in ("runner_0", "runner_1")] == ["success", "success"]
+        assert len(test_db.query("SELECT step_id FROM steps_output")) == 2
+
+
+class TestParallelExecution:
+    """Test parallel runner execution and pool lifetime"""
+
+    def test_failure_waits_for_other_runners(self):
+        """Test a raising runner surfaces only after the others have finished"""
+        finished = []
+
+        class _Slow:
+            steps = []
+
+            def execute(self):
+                time.sleep(0.2)
+                finished.append("slow")
+                return {}
+
+        class _Failing:
+            steps = []
+
+            def execute(self):
+                raise RuntimeError("runner failed")
+
+        with Pipeline([_Slow(), _Failing()]) as pipeline:
+            with pytest.raises(RuntimeError, match="runner failed"):
+                pipeline.execute(parallel=True)
+            assert finished == ["slow"]
+
+    def test_context_manager_shuts_down_pools(self):
+        """Test leaving the with-block closes the worker pool"""
+        with Pipeline(_runners(2)) as pipeline:
+            pipeline.execute(parallel=True)
+            executor = pipeline._executor
+            assert executor is not None
+
+        assert pipeline._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
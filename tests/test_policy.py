@@ -148,6 +148,27 @@ class TestPolicySet:
         assert len(policy_set.policies) == 1
         assert policy_set.policies[0].name == "require_tests"
 
+    def test_from_yaml_file_cache(self, temp_dir):
+        """Test cached loads return independent policies and see file edits"""
+        import os
+
+        yaml_path = temp_dir / "policies.yaml"
+        yaml_path.write_text(yaml.dump({"policies": [
+            {"name": "p1", "type": "change_type", "config": {"required_steps": ["test"]}}
+        ]}))
+
+        first = PolicySet.from_yaml_file(yaml_path)
+        first.policies[0].config["required_steps"].append("docs")
+        second = PolicySet.from_yaml_file(yaml_path)
+        assert second.policies[0].config["required_steps"] == ["test"]
+
+        yaml_path.write_text(yaml.dump({"policies": [
+            {"name": "p2", "type": "change_type", "config": {}}
+        ]}))
+        stat = yaml_path.stat()
+        os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert PolicySet.from_yaml_file(yaml_path).policies[0].name == "p2"
+
     def test_validate_all(self, test_db, temp_dir):
         """Test validating all policies"""
         policies = [
@@ -188,6 +209,43 @@ class TestPolicySet:
 
         assert len(violations) == 2
 
+    def test_validate_all_counts_evolutions_once(self, test_db, monkeypatch):
+        """Test evolution_count policies share a single count query"""
+        policy_set = PolicySet([
+            Policy("min_one", "evolution_count", config={"min_evolutions": 1}),
+            Policy("min_two", "evolution_count", config={"min_evolutions": 2}),
+        ])
+
+        gen = Generation(
+            version="v3.1.0",
+            changes=[GenerationChange("CH-004", "fix", "Bug")]
+        )
+        gen.save_to_db(test_db)
+
+        calls = []
+        query_one = test_db.query_one
+        monkeypatch.setattr(test_db, "query_one", lambda *a: calls.append(a) or query_one(*a))
+
+        violations = policy_set.validate_all("fix", "CH-004", gen.generation_id, test_db)
+
+        assert [v.policy_name for v in violations] == ["min_one", "min_two"]
+        assert violations[1].details["actual_count"] == 0
+        assert len(calls) == 1
+
+    def test_validate_all_caches_applicable_policies(self, test_db):
+        """Test the policies applying to a change type are filtered once"""
+        policy_set = PolicySet([
+            Policy("add_only", "change_type", config={"change_types": ["add"], "required_steps": ["test"]}),
+            Policy("disabled", "change_type", config={"required_steps": ["test"]}, enabled=False),
+        ])
+
+        violations = policy_set.validate_all("add", "CH-006", "gen", test_db, pipeline_steps=["build"])
+
+        assert [v.policy_name for v in violations] == ["add_only"]
+        assert [p.name for p in policy_set._applicable_by_type["add"]] == ["add_only"]
+        assert policy_set.validate_all("fix", "CH-006", "gen", test_db) == []
+        assert policy_set._applicable_by_type["fix"] == []
+
 
 class TestPolicyHook:
     """Test PolicyHook class"""
@@ -0,0 +1,27 @@
+"""Tests for gryt.runner module"""
+from gryt.runner import Runner
+from gryt.step import Step
+
+
+class _ResultStep(Step):
+    """Records a result, then adds a key to it as wrapper steps do"""
+
+    def run(self):
+        result = {"status": "success", "duration": 0.0}
+        self._record_output(result)
+        result["cache_key"] = "added-after-recording"
+        return result
+
+
+class TestRunner:
+    """Test Runner execution"""
+
+    def test_buffered_output_ignores_later_result_changes(self, test_db):
+        """Test rows buffered by a Runner match what a direct run stores"""
+        Runner([_ResultStep("buffered")], data=test_db).execute()
+        _ResultStep("direct", data=test_db).run()
+
+        rows = test_db.query("SELECT step_id, output_json FROM steps_output ORDER BY step_id")
+
+        assert [r["step_id"] for r in rows] == ["buffered", "direct"]
+        assert rows[0]["output_json"] == rows[1]["output_json"] == {"status": "success", "duration": 0.0}
@@ -133,6 +133,40 @@ class TestCloudSyncPull:
         assert result["updated"] == 0
         assert len(result["conflicts"]) == 0
 
+    def test_insert_from_cloud_keeps_hotfix_flag(self, test_db, temp_dir):
+        """Test a hot-fix pulled onto another machine is still listed as a hot-fix"""
+        from gryt.data import SqliteData
+        from gryt.hotfix import HotfixWorkflow
+
+        test_db.insert("generations", {"generation_id": "base", "version": "v1.2.0"})
+        hotfix = HotfixWorkflow(test_db).create_hotfix_generation(
+            "v1.2.0", "BUG-1", "Crash on start", description="Caller supplied"
+        )
+        payload = {**hotfix.to_dict(), "id": "cloud-hotfix"}
+        assert "is_hotfix" not in payload
+
+        mock_client = Mock()
+        mock_client.list_evolutions.return_value = {"evolutions": []}
+        other = SqliteData(db_path=str(temp_dir / "other.db"))
+        try:
+            sync = CloudSync(client=mock_client, data=other)
+            sync._insert_from_cloud(payload)
+            sync._insert_from_cloud({
+                "id": "cloud-release", "generation_id": "release", "version": "v1.3.0",
+                "description": "Regular release", "changes": [],
+            })
+            sync._insert_from_cloud({
+                "id": "cloud-flagged", "generation_id": "flagged", "version": "v1.3.1",
+                "description": "Renamed", "is_hotfix": True, "changes": [],
+            })
+
+            hotfixes = HotfixWorkflow(other).list_hotfixes()
+        finally:
+            other.close()
+
+        assert sorted(g.version for g in hotfixes) == ["v1.2.1", "v1.3.1"]
+        assert all(g.is_hotfix for g in hotfixes)
+
 
 class TestCloudSyncPush:
     """Test CloudSync.push() functionality"""